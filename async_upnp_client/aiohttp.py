@@ -33,7 +33,8 @@ _LOGGER_TRAFFIC_UPNP = logging.getLogger("async_upnp_client.traffic.upnp")
 
 def _fixed_host_header(url: str) -> Dict[str, str]:
     """Strip scope_id from IPv6 host, if needed."""
-    if "%" not in url:
+    # A scope_id can only be part of an IPv6 literal, i.e., between brackets.
+    if "%" not in url or "[" not in url:
         return {}
 
     url_parts = urlparse(url)
@@ -293,7 +294,11 @@ class AiohttpNotifyServer(UpnpNotifyServer):
                 strerror=err.strerror,
             ) from err
 
-        # Get listening port.
+        if self._source[1] != 0:
+            # Listening at the requested port.
+            return
+
+        # Get the listening port chosen by the OS.
         socks = self._server.sockets
         assert socks and len(socks) == 1
         sock = socks[0]
@@ -38,6 +38,7 @@ from async_upnp_client.utils import absolute_url, str_to_time, time_to_str
 
 _LOGGER = logging.getLogger(__name__)
 
+_CAN_PLAY_POLL_INTERVAL = 0.25  # seconds
 
 DeviceState = Enum("DeviceState", "ON PLAYING PAUSED IDLE")
 
@@ -867,13 +868,12 @@ class DmrDevice(ConnectionManagerMixin, UpnpProfileDevice):
 
     async def async_wait_for_can_play(self, max_wait_time: float = 5) -> None:
         """Wait for play command to be ready."""
-        loop_time = 0.25
         end_time = monotonic_timer() + max_wait_time
 
         while monotonic_timer() <= end_time:
             if self._can_transport_action("play"):
                 break
-            await asyncio.sleep(loop_time)
+            await asyncio.sleep(_CAN_PLAY_POLL_INTERVAL)
             # Check again before trying to poll, in case variable change event received
             if self._can_transport_action("play"):
                 break
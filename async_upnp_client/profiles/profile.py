@@ -3,8 +3,8 @@
 
 import asyncio
 import logging
-import time
 from datetime import timedelta
+from time import monotonic as monotonic_timer
 from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Union
 
 from async_upnp_client.client import (
@@ -243,7 +243,7 @@ class UpnpProfileDevice:
         assert self._event_handler
 
         if now is None:
-            now = time.monotonic()
+            now = monotonic_timer()
         renewal_threshold = now - RESUBSCRIBE_TOLERANCE_SECS
 
         _LOGGER.debug("Resubscribing to services with threshold %f", renewal_threshold)
@@ -284,7 +284,7 @@ class UpnpProfileDevice:
         _LOGGER.debug("_resubscribe_loop started")
         while self._subscriptions:
             next_renewal = min(self._subscriptions.values())
-            wait_time = next_renewal - time.monotonic() - RESUBSCRIBE_TOLERANCE_SECS
+            wait_time = next_renewal - monotonic_timer() - RESUBSCRIBE_TOLERANCE_SECS
             _LOGGER.debug("Resubscribing in %f seconds", wait_time)
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
@@ -339,7 +339,7 @@ class UpnpProfileDevice:
             return None
 
         # Using time.monotonic to avoid problems with system clock changes
-        now = time.monotonic()
+        now = monotonic_timer()
 
         try:
             if self._subscriptions:
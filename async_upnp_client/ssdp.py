@@ -124,6 +124,7 @@ def build_ssdp_packet(status_line: str, headers: SsdpHeaders) -> bytes:
     return f"{status_line}\r\n{headers_str}\r\n\r\n".encode()
 
 
+@lru_cache(maxsize=64)
 def build_ssdp_search_packet(
     ssdp_target: AddressTupleVXType, ssdp_mx: int, ssdp_st: str
 ) -> bytes:
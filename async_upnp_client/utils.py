@@ -8,6 +8,7 @@ from collections import defaultdict
 from collections.abc import Mapping as abcMapping
 from collections.abc import MutableMapping as abcMutableMapping
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from socket import AddressFamily  # pylint: disable=no-name-in-module
 from typing import Any, Callable, Dict, Generator, Optional, Tuple
 from urllib.parse import urljoin, urlsplit
@@ -72,8 +73,14 @@ class CaseInsensitiveDict(abcMutableMapping):
 
     def __init__(self, data: Optional[abcMapping] = None, **kwargs: Any) -> None:
         """Initialize."""
-        self._data: Dict[str, Any] = {**(data or {}), **kwargs}
-        self._case_map: Dict[str, Any] = {
+        if isinstance(data, CaseInsensitiveDict) and not kwargs:
+            # Keys are already mapped, no need to lower them again.
+            self._data: Dict[str, Any] = data.as_dict().copy()
+            self._case_map: Dict[str, Any] = data.case_map().copy()
+            return
+
+        self._data = {**(data or {}), **kwargs}
+        self._case_map = {
             k
             if type(k) is lowerstr  # pylint: disable=unidiomatic-typecheck
             else k.lower(): k
@@ -85,11 +92,7 @@ class CaseInsensitiveDict(abcMutableMapping):
 
         Returns a copy of CaseInsensitiveDict.
         """
-        # pylint: disable=protected-access
-        _copy = CaseInsensitiveDict.__new__(CaseInsensitiveDict)
-        _copy._data = self._data.copy()
-        _copy._case_map = self._case_map.copy()
-        return _copy
+        return CaseInsensitiveDict(self)
 
     def combine(self, other: "CaseInsensitiveDict") -> "CaseInsensitiveDict":
         """Combine a CaseInsensitiveDict with another CaseInsensitiveDict.
@@ -216,6 +219,7 @@ def time_to_str(time: timedelta) -> str:
     return "{sign}{hours}:{minutes}:{seconds}".format(**target)
 
 
+@lru_cache(maxsize=256)
 def str_to_time(string: str) -> Optional[timedelta]:
     """Convert a string to timedelta."""
     match = TIME_RE.match(string)
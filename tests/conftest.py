@@ -5,13 +5,56 @@ import asyncio
 import os.path
 from collections import deque
 from copy import deepcopy
-from typing import Deque, Mapping, MutableMapping, Optional, Tuple, cast
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    ChainMap,
+    Deque,
+    Generator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    cast,
+)
 
-from async_upnp_client.client import UpnpRequester
+import pytest
+
+from async_upnp_client.client import (
+    _UNDEFINED,
+    UpnpDevice,
+    UpnpRequester,
+    UpnpStateVariable,
+)
+from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.const import AddressTupleVXType
 from async_upnp_client.event_handler import UpnpEventHandler, UpnpNotifyServer
+from async_upnp_client.profiles.dlna import DmrDevice, DmsDevice
+from async_upnp_client.profiles.igd import IgdDevice
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command line options."""
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        default=False,
+        help="Run the tests on uvloop, which must be installed, instead of asyncio.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run the tests on uvloop, when requested."""
+    # pylint: disable=import-outside-toplevel
+    if not config.getoption("uvloop"):
+        return
+
+    import uvloop
 
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
+
+@lru_cache(maxsize=None)
 def read_file(filename: str) -> str:
     """Read file."""
     path = os.path.join("tests", "fixtures", filename)
@@ -22,19 +65,26 @@ def read_file(filename: str) -> str:
 class UpnpTestRequester(UpnpRequester):
     """Test requester."""
 
-    # pylint: disable=too-few-public-methods
-
     def __init__(
         self,
         response_map: Mapping[Tuple[str, str], Tuple[int, Mapping[str, str], str]],
     ) -> None:
         """Class initializer."""
-        self.response_map: MutableMapping[
+        self.response_map: ChainMap[
             Tuple[str, str],
-            Tuple[int, MutableMapping[str, str], str],
-        ] = deepcopy(cast(MutableMapping, response_map))
+            Tuple[int, Mapping[str, str], str],
+        ] = ChainMap({}, cast(MutableMapping, response_map))
         self.exceptions: Deque[Optional[Exception]] = deque()
 
+    def push_overrides(self) -> None:
+        """Add a new, empty, layer of overrides to the response map."""
+        self.response_map = self.response_map.new_child()
+
+    def pop_overrides(self) -> None:
+        """Drop the last layer of overrides, and any pending exceptions."""
+        self.response_map = self.response_map.parents
+        self.exceptions.clear()
+
     async def async_http_request(
         self,
         method: str,
@@ -57,142 +107,156 @@ class UpnpTestRequester(UpnpRequester):
         return self.response_map[key]
 
 
-RESPONSE_MAP: Mapping[Tuple[str, str], Tuple[int, Mapping[str, str], str]] = {
-    # DLNA/DMR
-    ("GET", "http://dlna_dmr:1234/device.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/device.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/device_embedded.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/device_embedded.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/device_incomplete.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/device_incomplete.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/device_with_empty_descriptor.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/device_with_empty_descriptor.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/RenderingControl_1.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/RenderingControl_1.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/ConnectionManager_1.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/ConnectionManager_1.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/AVTransport_1.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/AVTransport_1.xml"),
-    ),
-    ("GET", "http://dlna_dmr:1234/Empty_Descriptor.xml"): (
-        200,
-        {},
-        read_file("dlna/dmr/Empty_Descriptor.xml"),
-    ),
-    ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/ConnectionManager1"): (
-        200,
-        {"sid": "uuid:dummy-cm1", "timeout": "Second-175"},
-        "",
-    ),
-    ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1"): (
-        200,
-        {"sid": "uuid:dummy", "timeout": "Second-300"},
-        "",
-    ),
-    ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/AVTransport1"): (
-        200,
-        {"sid": "uuid:dummy-avt1", "timeout": "Second-150"},
-        "",
-    ),
-    ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/QPlay"): (
-        200,
-        {"sid": "uuid:dummy-qp1", "timeout": "Second-150"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/ConnectionManager1"): (
-        200,
-        {"sid": "uuid:dummy-cm1"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1"): (
-        200,
-        {"sid": "uuid:dummy"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/AVTransport1"): (
-        200,
-        {"sid": "uuid:dummy-avt1"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/QPlay"): (
-        200,
-        {"sid": "uuid:dummy-qp1"},
-        "",
-    ),
-    # DLNA/DMS
-    ("GET", "http://dlna_dms:1234/device.xml"): (
-        200,
-        {},
-        read_file("dlna/dms/device.xml"),
-    ),
-    ("GET", "http://dlna_dms:1234/ConnectionManager_1.xml"): (
-        200,
-        {},
-        read_file("dlna/dms/ConnectionManager_1.xml"),
-    ),
-    ("GET", "http://dlna_dms:1234/ContentDirectory_1.xml"): (
-        200,
-        {},
-        read_file("dlna/dms/ContentDirectory_1.xml"),
-    ),
-    ("SUBSCRIBE", "http://dlna_dms:1234/upnp/event/ConnectionManager1"): (
-        200,
-        {"sid": "uuid:dummy-cm1", "timeout": "Second-150"},
-        "",
-    ),
-    ("SUBSCRIBE", "http://dlna_dms:1234/upnp/event/ContentDirectory1"): (
-        200,
-        {"sid": "uuid:dummy-cd1", "timeout": "Second-150"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dms:1234/upnp/event/ConnectionManager1"): (
-        200,
-        {"sid": "uuid:dummy-cm1"},
-        "",
-    ),
-    ("UNSUBSCRIBE", "http://dlna_dms:1234/upnp/event/ContentDirectory1"): (
-        200,
-        {"sid": "uuid:dummy-cd1"},
-        "",
-    ),
-    # IGD
-    ("GET", "http://igd:1234/device.xml"): (200, {}, read_file("igd/device.xml")),
-    ("GET", "http://igd:1234/Layer3Forwarding.xml"): (
-        200,
-        {},
-        read_file("igd/Layer3Forwarding.xml"),
-    ),
-    ("GET", "http://igd:1234/WANCommonInterfaceConfig.xml"): (
-        200,
-        {},
-        read_file("igd/WANCommonInterfaceConfig.xml"),
-    ),
-    ("GET", "http://igd:1234/WANIPConnection.xml"): (
-        200,
-        {},
-        read_file("igd/WANIPConnection.xml"),
-    ),
-}
+def freeze_response_map(
+    response_map: Mapping[Tuple[str, str], Tuple[int, Mapping[str, str], str]]
+) -> Mapping[Tuple[str, str], Tuple[int, Mapping[str, str], str]]:
+    """Make a response map, including the headers of its responses, read-only."""
+    return MappingProxyType(
+        {
+            key: (status, MappingProxyType(dict(headers)), body)
+            for key, (status, headers, body) in response_map.items()
+        }
+    )
+
+
+RESPONSE_MAP = freeze_response_map(
+    {
+        # DLNA/DMR
+        ("GET", "http://dlna_dmr:1234/device.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/device.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/device_embedded.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/device_embedded.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/device_incomplete.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/device_incomplete.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/device_with_empty_descriptor.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/device_with_empty_descriptor.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/RenderingControl_1.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/RenderingControl_1.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/ConnectionManager_1.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/ConnectionManager_1.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/AVTransport_1.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/AVTransport_1.xml"),
+        ),
+        ("GET", "http://dlna_dmr:1234/Empty_Descriptor.xml"): (
+            200,
+            {},
+            read_file("dlna/dmr/Empty_Descriptor.xml"),
+        ),
+        ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/ConnectionManager1"): (
+            200,
+            {"sid": "uuid:dummy-cm1", "timeout": "Second-175"},
+            "",
+        ),
+        ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1"): (
+            200,
+            {"sid": "uuid:dummy", "timeout": "Second-300"},
+            "",
+        ),
+        ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/AVTransport1"): (
+            200,
+            {"sid": "uuid:dummy-avt1", "timeout": "Second-150"},
+            "",
+        ),
+        ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/QPlay"): (
+            200,
+            {"sid": "uuid:dummy-qp1", "timeout": "Second-150"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/ConnectionManager1"): (
+            200,
+            {"sid": "uuid:dummy-cm1"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1"): (
+            200,
+            {"sid": "uuid:dummy"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/AVTransport1"): (
+            200,
+            {"sid": "uuid:dummy-avt1"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dmr:1234/upnp/event/QPlay"): (
+            200,
+            {"sid": "uuid:dummy-qp1"},
+            "",
+        ),
+        # DLNA/DMS
+        ("GET", "http://dlna_dms:1234/device.xml"): (
+            200,
+            {},
+            read_file("dlna/dms/device.xml"),
+        ),
+        ("GET", "http://dlna_dms:1234/ConnectionManager_1.xml"): (
+            200,
+            {},
+            read_file("dlna/dms/ConnectionManager_1.xml"),
+        ),
+        ("GET", "http://dlna_dms:1234/ContentDirectory_1.xml"): (
+            200,
+            {},
+            read_file("dlna/dms/ContentDirectory_1.xml"),
+        ),
+        ("SUBSCRIBE", "http://dlna_dms:1234/upnp/event/ConnectionManager1"): (
+            200,
+            {"sid": "uuid:dummy-cm1", "timeout": "Second-150"},
+            "",
+        ),
+        ("SUBSCRIBE", "http://dlna_dms:1234/upnp/event/ContentDirectory1"): (
+            200,
+            {"sid": "uuid:dummy-cd1", "timeout": "Second-150"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dms:1234/upnp/event/ConnectionManager1"): (
+            200,
+            {"sid": "uuid:dummy-cm1"},
+            "",
+        ),
+        ("UNSUBSCRIBE", "http://dlna_dms:1234/upnp/event/ContentDirectory1"): (
+            200,
+            {"sid": "uuid:dummy-cd1"},
+            "",
+        ),
+        # IGD
+        ("GET", "http://igd:1234/device.xml"): (200, {}, read_file("igd/device.xml")),
+        ("GET", "http://igd:1234/Layer3Forwarding.xml"): (
+            200,
+            {},
+            read_file("igd/Layer3Forwarding.xml"),
+        ),
+        ("GET", "http://igd:1234/WANCommonInterfaceConfig.xml"): (
+            200,
+            {},
+            read_file("igd/WANCommonInterfaceConfig.xml"),
+        ),
+        ("GET", "http://igd:1234/WANIPConnection.xml"): (
+            200,
+            {},
+            read_file("igd/WANIPConnection.xml"),
+        ),
+    }
+)
 
 
 class UpnpTestNotifyServer(UpnpNotifyServer):
@@ -223,3 +287,144 @@ class UpnpTestNotifyServer(UpnpNotifyServer):
     async def async_stop_server(self) -> None:
         """Stop the server."""
         await self.event_handler.async_unsubscribe_all()
+
+
+@pytest.fixture(scope="module")
+def module_requester() -> UpnpTestRequester:
+    """Get a requester shared by the tests of a module, see push_overrides."""
+    return UpnpTestRequester(RESPONSE_MAP)
+
+
+def create_device_template(
+    description_url: str, non_strict: bool = False
+) -> UpnpDevice:
+    """Create a device from RESPONSE_MAP, outside of any test's event loop."""
+    factory = UpnpFactory(UpnpTestRequester(RESPONSE_MAP), non_strict=non_strict)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(factory.async_create_device(description_url))
+    finally:
+        loop.close()
+
+
+def clone_device(template: UpnpDevice, requester: UpnpRequester) -> UpnpDevice:
+    """Copy a device template, with the copy using requester for its requests."""
+    # The state variables' sentinels are compared by identity, keep them as is.
+    memo = {
+        id(template.requester): requester,
+        id(_UNDEFINED): _UNDEFINED,
+        id(UpnpStateVariable.UPNP_VALUE_ERROR): UpnpStateVariable.UPNP_VALUE_ERROR,
+    }
+    return deepcopy(template, memo)
+
+
+@pytest.fixture(name="requester")
+def fixture_requester(
+    module_requester: UpnpTestRequester,
+) -> Generator[UpnpTestRequester, None, None]:
+    """Get the module's requester, with the overrides of this test undone after it."""
+    # pylint: disable=redefined-outer-name
+    module_requester.push_overrides()
+    yield module_requester
+    module_requester.pop_overrides()
+
+
+@pytest.fixture(scope="session")
+def dmr_device_template() -> UpnpDevice:
+    """Get the DLNA/DMR device, created once per session."""
+    return create_device_template("http://dlna_dmr:1234/device.xml")
+
+
+@pytest.fixture
+def dmr_device(
+    dmr_device_template: UpnpDevice, requester: UpnpTestRequester
+) -> UpnpDevice:
+    """Get the DLNA/DMR device."""
+    # pylint: disable=redefined-outer-name
+    return clone_device(dmr_device_template, requester)
+
+
+@pytest.fixture(scope="session")
+def dmr_device_non_strict_template() -> UpnpDevice:
+    """Get the DLNA/DMR device, created in non-strict mode once per session."""
+    return create_device_template("http://dlna_dmr:1234/device.xml", non_strict=True)
+
+
+@pytest.fixture
+def dmr_device_non_strict(
+    dmr_device_non_strict_template: UpnpDevice, requester: UpnpTestRequester
+) -> UpnpDevice:
+    """Get the DLNA/DMR device, created in non-strict mode."""
+    # pylint: disable=redefined-outer-name
+    return clone_device(dmr_device_non_strict_template, requester)
+
+
+@pytest.fixture
+def dmr_event_handler(requester: UpnpTestRequester) -> UpnpEventHandler:
+    """Get an event handler for the DLNA/DMR device."""
+    # pylint: disable=redefined-outer-name
+    notify_server = UpnpTestNotifyServer(
+        requester=requester,
+        source=("192.168.1.2", 8090),
+    )
+    return notify_server.event_handler
+
+
+@pytest.fixture
+def dmr_profile(dmr_device: UpnpDevice) -> DmrDevice:
+    """Get a DmrDevice profile for the DLNA/DMR device, without event handling."""
+    # pylint: disable=redefined-outer-name
+    return DmrDevice(dmr_device, event_handler=None)
+
+
+@pytest.fixture
+def dmr_evented_profile(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> DmrDevice:
+    """Get a DmrDevice profile for the DLNA/DMR device, with event handling."""
+    # pylint: disable=redefined-outer-name
+    return DmrDevice(dmr_device, event_handler=dmr_event_handler)
+
+
+@pytest.fixture(scope="session")
+def dms_device_template() -> UpnpDevice:
+    """Get the DLNA/DMS device, created once per session."""
+    return create_device_template("http://dlna_dms:1234/device.xml")
+
+
+@pytest.fixture
+def dms_device(
+    dms_device_template: UpnpDevice, requester: UpnpTestRequester
+) -> UpnpDevice:
+    """Get the DLNA/DMS device."""
+    # pylint: disable=redefined-outer-name
+    return clone_device(dms_device_template, requester)
+
+
+@pytest.fixture
+def dms_profile(dms_device: UpnpDevice) -> DmsDevice:
+    """Get a DmsDevice profile for the DLNA/DMS device, without event handling."""
+    # pylint: disable=redefined-outer-name
+    return DmsDevice(dms_device, event_handler=None)
+
+
+@pytest.fixture(scope="session")
+def igd_device_template() -> UpnpDevice:
+    """Get the IGD device, created once per session."""
+    return create_device_template("http://igd:1234/device.xml")
+
+
+@pytest.fixture
+def igd_device(
+    igd_device_template: UpnpDevice, requester: UpnpTestRequester
+) -> UpnpDevice:
+    """Get the IGD device."""
+    # pylint: disable=redefined-outer-name
+    return clone_device(igd_device_template, requester)
+
+
+@pytest.fixture
+def igd_profile(igd_device: UpnpDevice) -> IgdDevice:
+    """Get an IgdDevice profile for the IGD device, without event handling."""
+    # pylint: disable=redefined-outer-name
+    return IgdDevice(igd_device, event_handler=None)
@@ -1,17 +1,20 @@
 """Unit tests for the DLNA DMR profile."""
 
 import asyncio
+import re
 import sys
 import time
-from typing import List, Sequence
+import xml.etree.ElementTree as ET
+from collections import deque
+from types import MappingProxyType
+from typing import Any, List, Mapping, Sequence, Union
 from unittest import mock
 
-import defusedxml.ElementTree
 import pytest
 from didl_lite import didl_lite
 
-from async_upnp_client.client import UpnpService, UpnpStateVariable
-from async_upnp_client.client_factory import UpnpFactory
+from async_upnp_client.client import UpnpDevice, UpnpService, UpnpStateVariable
+from async_upnp_client.event_handler import UpnpEventHandler
 from async_upnp_client.profiles.dlna import (
     DmrDevice,
     _parse_last_change_event,
@@ -19,7 +22,9 @@ from async_upnp_client.profiles.dlna import (
     split_commas,
 )
 
-from ..conftest import RESPONSE_MAP, UpnpTestNotifyServer, UpnpTestRequester, read_file
+from ..conftest import UpnpTestRequester, read_file
+
+AVT_CONTROL_KEY = ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
 
 AVT_NOTIFY_HEADERS = {
     "NT": "upnp:event",
@@ -27,7 +32,10 @@ AVT_NOTIFY_HEADERS = {
     "SID": "uuid:dummy-avt1",
 }
 
-AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT = """
+AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT = re.sub(
+    r"\n\s*",
+    "",
+    """
 <e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0">
     <e:property>
         <LastChange>
@@ -39,20 +47,93 @@ AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT = """
         </LastChange>
     </e:property>
 </e:propertyset>
-"""
+""",
+)
+
+RCS_NOTIFY_BODY = re.sub(
+    r"\n\s*",
+    "",
+    """
+<e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0">
+    <e:property>
+        <LastChange>
+            &lt;Event xmlns=&quot;urn:schemas-upnp-org:metadata-1-0/RCS/&quot;&gt;
+                &lt;InstanceID val=&quot;0&quot;&gt;
+                    &lt;Mute channel=&quot;Master&quot; val=&quot;0&quot;/&gt;
+                    &lt;Volume channel=&quot;Master&quot; val=&quot;50&quot;/&gt;
+                    &lt;/InstanceID&gt;
+            &lt;/Event&gt;
+        </LastChange>
+    </e:property>
+</e:propertyset>
+""",
+)
+
+AVT_NOTIFY_BODY_STOP = AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT.format(
+    actions="Stop"
+)
+AVT_NOTIFY_BODY_PAUSE_PLAY = AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT.format(
+    actions="Pause,Play"
+)
 
+EXPECTED_DEFAULT_DIDL_TREE = ET.fromstring(
+    '<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/"'
+    ' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+    ' xmlns:sec="http://www.sec.co.kr/"'
+    ' xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">'
+    '<item id="0" parentID="-1" restricted="false">'
+    "<dc:title>Test music</dc:title>"
+    "<upnp:class>object.item</upnp:class>"
+    '<res protocolInfo="http-get:*:application/octet-stream:*">'
+    "http://dlna_dms:4321/object/file_1222"
+    "</res>"
+    "</item>"
+    "</DIDL-Lite>"
+)
 
-def assert_xml_equal(
-    left: defusedxml.ElementTree, right: defusedxml.ElementTree
-) -> None:
+SERVER_HEAD_RESPONSE = (
+    200,
+    MappingProxyType(
+        {
+            "ContentFeatures.dlna.org": "DLNA_SERVER_FEATURES",
+            "Content-Type": "video/server-mime",
+        }
+    ),
+    "",
+)
+
+
+@pytest.fixture
+def fast_poll(monkeypatch: pytest.MonkeyPatch) -> float:
+    """Poll for the ability to play more often, to not delay tests too long."""
+    poll_interval = 0.01
+    monkeypatch.setattr(
+        "async_upnp_client.profiles.dlna._CAN_PLAY_POLL_INTERVAL", poll_interval
+    )
+    return poll_interval
+
+
+def assert_xml_equal(left: ET.Element, right: ET.Element) -> None:
     """Check two XML trees are equal."""
-    assert left.tag == right.tag
-    assert left.text == right.text
-    assert left.tail == right.tail
-    assert left.attrib == right.attrib
-    assert len(left) == len(right)
-    for left_child, right_child in zip(left, right):
-        assert_xml_equal(left_child, right_child)
+    stack = deque([(left, right)])
+    while stack:
+        left_el, right_el = stack.pop()
+        assert left_el.tag == right_el.tag
+        assert left_el.text == right_el.text
+        assert left_el.tail == right_el.tail
+        assert left_el.attrib == right_el.attrib
+        assert len(left_el) == len(right_el)
+        stack.extend(zip(left_el, right_el))
+
+
+async def construct_metadata(
+    profile: DmrDevice, media_url: str, media_title: str, **kwargs: Any
+) -> Union[didl_lite.DidlObject, didl_lite.Descriptor]:
+    """Construct play media metadata and parse it back to a DIDL-Lite object."""
+    metadata_xml = await profile.construct_play_media_metadata(
+        media_url, media_title, **kwargs
+    )
+    return didl_lite.from_xml_string(metadata_xml)[0]
 
 
 def test_parse_last_change_event() -> None:
@@ -132,15 +213,16 @@ def test_split_commas(value: str, expected: List[str]) -> None:
 
 
 @pytest.mark.asyncio
-async def test_on_notify_dlna_event() -> None:
+async def test_on_notify_dlna_event(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test handling an event.."""
     changed_vars: List[UpnpStateVariable] = []
 
     def on_event(
         _self: UpnpService, changed_state_variables: Sequence[UpnpStateVariable]
     ) -> None:
-        nonlocal changed_vars
-        changed_vars += changed_state_variables
+        changed_vars.extend(changed_state_variables)
 
         assert changed_state_variables
         if changed_state_variables[0].name == "LastChange":
@@ -149,111 +231,77 @@ async def test_on_notify_dlna_event() -> None:
 
             dlna_handle_notify_last_change(last_change)
 
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+    service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
     service.on_event = on_event
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    await event_handler.async_subscribe(service)
+    await dmr_event_handler.async_subscribe(service)
 
     headers = {
         "NT": "upnp:event",
         "NTS": "upnp:propchange",
         "SID": "uuid:dummy",
     }
-    body = """
-<e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0">
-    <e:property>
-        <LastChange>
-            &lt;Event xmlns=&quot;urn:schemas-upnp-org:metadata-1-0/RCS/&quot;&gt;
-                &lt;InstanceID val=&quot;0&quot;&gt;
-                    &lt;Mute channel=&quot;Master&quot; val=&quot;0&quot;/&gt;
-                    &lt;Volume channel=&quot;Master&quot; val=&quot;50&quot;/&gt;
-                    &lt;/InstanceID&gt;
-            &lt;/Event&gt;
-        </LastChange>
-    </e:property>
-</e:propertyset>
-"""
-
-    result = await event_handler.handle_notify(headers, body)
+    result = await dmr_event_handler.handle_notify(headers, RCS_NOTIFY_BODY)
     assert result == 200
 
     assert len(changed_vars) == 3
 
-    state_var = service.state_variable("Volume")
-    assert state_var.value == 50
+    assert service.state_variable("Volume").value == 50
 
 
 @pytest.mark.asyncio
-async def test_wait_for_can_play_evented() -> None:
+async def test_wait_for_can_play_evented(
+    dmr_evented_profile: DmrDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test async_wait_for_can_play with a variable change event."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = DmrDevice(device, event_handler=event_handler)
+    profile = dmr_evented_profile
     await profile.async_subscribe_services()
-
-    # Send a NOTIFY of CurrentTransportActions without Play
-    result = await event_handler.handle_notify(
-        AVT_NOTIFY_HEADERS,
-        AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT.format(actions="Stop"),
-    )
-    assert result == 200
-
-    # Should not be able to play yet
-    assert not profile.can_play
-
-    # Trigger variable change event in 0.1 seconds, less than the sleep time of
-    # the wait loop
-    async def delayed_notify() -> None:
-        await asyncio.sleep(0.1)
-        # Send NOTIFY of change to CurrentTransportActions
-        result = await event_handler.handle_notify(
+    try:
+        # Send a NOTIFY of CurrentTransportActions without Play
+        result = await dmr_event_handler.handle_notify(
             AVT_NOTIFY_HEADERS,
-            AVT_CURRENT_TRANSPORT_ACTIONS_NOTIFY_BODY_FMT.format(actions="Pause,Play"),
+            AVT_NOTIFY_BODY_STOP,
         )
         assert result == 200
 
-    loop = asyncio.get_event_loop()
-    notify_task = loop.create_task(delayed_notify())
-    assert notify_task
+        # Should not be able to play yet
+        assert not profile.can_play
 
-    # Call async_wait_for_can_play and check it returned shortly after notification
-    started = time.monotonic()
-    await profile.async_wait_for_can_play()
-    waited_time = time.monotonic() - started
+        # Trigger variable change event in 0.1 seconds, less than the sleep time of
+        # the wait loop
+        async def delayed_notify() -> None:
+            await asyncio.sleep(0.1)
+            # Send NOTIFY of change to CurrentTransportActions
+            result = await dmr_event_handler.handle_notify(
+                AVT_NOTIFY_HEADERS,
+                AVT_NOTIFY_BODY_PAUSE_PLAY,
+            )
+            assert result == 200
 
-    assert 0.1 <= waited_time <= 0.5
+        notify_task = asyncio.create_task(delayed_notify())
 
-    assert profile.can_play
+        # Call async_wait_for_can_play and check it returned shortly after notification
+        started = time.monotonic()
+        await profile.async_wait_for_can_play()
+        waited_time = time.monotonic() - started
+
+        assert 0.1 <= waited_time <= 0.5
 
-    await profile.async_unsubscribe_services()
+        assert profile.can_play
+        await notify_task
+    finally:
+        await profile.async_unsubscribe_services()
 
 
 @pytest.mark.asyncio
-async def test_wait_for_can_play_polled() -> None:
+async def test_wait_for_can_play_polled(
+    requester: UpnpTestRequester, dmr_profile: DmrDevice, fast_poll: float
+) -> None:
     """Test async_wait_for_can_play polling state variables."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    profile = DmrDevice(device, event_handler=None)
+    # pylint: disable=redefined-outer-name
+    profile = dmr_profile
 
     # Polling of CurrentTransportActions does not contain "Play" yet
-    requester.response_map[
-        ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
-    ] = (
+    requester.response_map[AVT_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dmr/action_GetCurrentTransportActions_Stop.xml"),
@@ -268,9 +316,7 @@ async def test_wait_for_can_play_polled() -> None:
     assert not profile.can_play
 
     # Polling of CurrentTransportActions now contains "Play"
-    requester.response_map[
-        ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
-    ] = (
+    requester.response_map[AVT_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dmr/action_GetCurrentTransportActions_PlaySeek.xml"),
@@ -281,23 +327,20 @@ async def test_wait_for_can_play_polled() -> None:
     await profile.async_wait_for_can_play()
     waited_time = time.monotonic() - started
 
-    assert 0.1 <= waited_time <= 1.0
+    assert fast_poll <= waited_time <= 1.0
 
     assert profile.can_play
 
 
 @pytest.mark.asyncio
-async def test_wait_for_can_play_timeout() -> None:
+async def test_wait_for_can_play_timeout(
+    requester: UpnpTestRequester, dmr_profile: DmrDevice
+) -> None:
     """Test async_wait_for_can_play times out waiting for ability to play."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    profile = DmrDevice(device, event_handler=None)
+    profile = dmr_profile
 
     # Polling of CurrentTransportActions does not contain "Play" yet
-    requester.response_map[
-        ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
-    ] = (
+    requester.response_map[AVT_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dmr/action_GetCurrentTransportActions_Stop.xml"),
@@ -323,13 +366,10 @@ async def test_wait_for_can_play_timeout() -> None:
 
 @pytest.mark.skipif(sys.version_info < (3, 8), reason="Need Python 3.8 for AsyncMock")
 @pytest.mark.asyncio
-async def test_fetch_headers() -> None:
+async def test_fetch_headers(dmr_profile: DmrDevice) -> None:
     """Test _fetch_headers when the server supports HEAD, GET with range, or just GET."""
     # pylint: disable=protected-access
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    profile = DmrDevice(device, event_handler=None)
+    profile = dmr_profile
 
     media_url = "http://dlna_dms:4321/object/file_1222"
     fetch_headers = {"GetContentFeatures.dlna.org": "1"}
@@ -410,18 +450,9 @@ async def test_fetch_headers() -> None:
 
 
 @pytest.mark.asyncio
-async def test_construct_play_media_metadata_types() -> None:
-    """Test various MIME and UPnP type options for construct_play_media_metadata."""
-    # pylint: disable=too-many-statements
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = DmrDevice(device, event_handler=event_handler)
+async def test_construct_play_media_metadata_xml(dmr_profile: DmrDevice) -> None:
+    """Test the DIDL-Lite XML generated by construct_play_media_metadata."""
+    profile = dmr_profile
 
     media_url = "http://dlna_dms:4321/object/file_1222"
     media_title = "Test music"
@@ -429,247 +460,169 @@ async def test_construct_play_media_metadata_types() -> None:
     # No server to supply DLNA headers
     metadata_xml = await profile.construct_play_media_metadata(media_url, media_title)
     # Sanity check that didl_lite is giving expected XML
-    expected_xml = defusedxml.ElementTree.fromstring(
-        """<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/"
- xmlns:dc="http://purl.org/dc/elements/1.1/"
- xmlns:sec="http://www.sec.co.kr/"
- xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">
-<item id="0" parentID="-1" restricted="false">
-<dc:title>Test music</dc:title>
-<upnp:class>object.item</upnp:class>
-<res protocolInfo="http-get:*:application/octet-stream:*">
-http://dlna_dms:4321/object/file_1222
-</res>
-</item>
-</DIDL-Lite>""".replace(
-            "\n", ""
-        )
-    )
-    assert_xml_equal(defusedxml.ElementTree.fromstring(metadata_xml), expected_xml)
+    assert_xml_equal(ET.fromstring(metadata_xml), EXPECTED_DEFAULT_DIDL_TREE)
 
     metadata = didl_lite.from_xml_string(metadata_xml)[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item"
     assert metadata.res
     assert metadata.res is metadata.resources
-    assert metadata.res[0].uri == media_url
-    assert metadata.res[0].protocol_info == "http-get:*:application/octet-stream:*"
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(media_url + ".mp3", media_title)
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.audioItem"
-    assert metadata.res[0].uri == media_url + ".mp3"
-    assert metadata.res[0].protocol_info == "http-get:*:audio/mpeg:*"
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, default_mime_type="video/test-mime"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert metadata.res[0].protocol_info == "http-get:*:video/test-mime:*"
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url_suffix, kwargs, expected_upnp_class, expected_protocol_info",
+    (
+        pytest.param(
+            "", {}, "object.item", "http-get:*:application/octet-stream:*", id="default"
+        ),
+        (".mp3", {}, "object.item.audioItem", "http-get:*:audio/mpeg:*"),
+        (
+            "",
+            {"default_mime_type": "video/test-mime"},
+            "object.item.videoItem",
+            "http-get:*:video/test-mime:*",
+        ),
+        (
+            "",
+            {"default_upnp_class": "object.item.imageItem"},
+            "object.item.imageItem",
+            "http-get:*:application/octet-stream:*",
+        ),
+        (
+            "",
+            {"override_mime_type": "video/test-mime"},
+            "object.item.videoItem",
+            "http-get:*:video/test-mime:*",
+        ),
+        (
+            "",
+            {"override_upnp_class": "object.item.imageItem"},
+            "object.item.imageItem",
+            "http-get:*:application/octet-stream:*",
+        ),
+        (
+            "",
+            {"override_dlna_features": "DLNA_OVERRIDE_FEATURES"},
+            "object.item",
+            "http-get:*:application/octet-stream:DLNA_OVERRIDE_FEATURES",
+        ),
+        (
+            "",
+            {
+                "override_mime_type": "video/test-mime",
+                "override_dlna_features": "DLNA_OVERRIDE_FEATURES",
+            },
+            "object.item.videoItem",
+            "http-get:*:video/test-mime:DLNA_OVERRIDE_FEATURES",
+        ),
+    ),
+)
+async def test_construct_play_media_metadata_types(
+    dmr_profile: DmrDevice,
+    url_suffix: str,
+    kwargs: Mapping[str, Any],
+    expected_upnp_class: str,
+    expected_protocol_info: str,
+) -> None:
+    """Test various MIME and UPnP type options for construct_play_media_metadata."""
+    profile = dmr_profile
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, default_upnp_class="object.item.imageItem"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.imageItem"
-    assert metadata.res[0].uri == media_url
-    assert metadata.res[0].protocol_info == "http-get:*:application/octet-stream:*"
+    media_url = "http://dlna_dms:4321/object/file_1222" + url_suffix
+    media_title = "Test music"
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, override_mime_type="video/test-mime"
-        )
-    )[0]
+    # No server to supply DLNA headers
+    metadata = await construct_metadata(profile, media_url, media_title, **kwargs)
     assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
+    assert metadata.upnp_class == expected_upnp_class
     assert metadata.res[0].uri == media_url
-    assert metadata.res[0].protocol_info == "http-get:*:video/test-mime:*"
+    assert metadata.res[0].protocol_info == expected_protocol_info
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, override_upnp_class="object.item.imageItem"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.imageItem"
-    assert metadata.res[0].uri == media_url
-    assert metadata.res[0].protocol_info == "http-get:*:application/octet-stream:*"
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            override_dlna_features="DLNA_OVERRIDE_FEATURES",
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:application/octet-stream:DLNA_OVERRIDE_FEATURES"
-    )
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url_suffix, kwargs, expected_upnp_class, expected_protocol_info",
+    (
+        (
+            "",
+            {},
+            "object.item.videoItem",
+            "http-get:*:video/server-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            ".mp3",
+            {},
+            "object.item.videoItem",
+            "http-get:*:video/server-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            "",
+            {"default_mime_type": "video/test-mime"},
+            "object.item.videoItem",
+            "http-get:*:video/server-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            "",
+            {"default_upnp_class": "object.item.imageItem"},
+            "object.item.videoItem",
+            "http-get:*:video/server-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            "",
+            {"override_mime_type": "image/test-mime"},
+            "object.item.imageItem",
+            "http-get:*:image/test-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            "",
+            {"override_upnp_class": "object.item.imageItem"},
+            "object.item.imageItem",
+            "http-get:*:video/server-mime:DLNA_SERVER_FEATURES",
+        ),
+        (
+            "",
+            {"override_dlna_features": "DLNA_OVERRIDE_FEATURES"},
+            "object.item.videoItem",
+            "http-get:*:video/server-mime:DLNA_OVERRIDE_FEATURES",
+        ),
+        (
+            "",
+            {
+                "override_mime_type": "image/test-mime",
+                "override_dlna_features": "DLNA_OVERRIDE_FEATURES",
+            },
+            "object.item.imageItem",
+            "http-get:*:image/test-mime:DLNA_OVERRIDE_FEATURES",
+        ),
+    ),
+)
+async def test_construct_play_media_metadata_types_server(
+    requester: UpnpTestRequester,
+    dmr_profile: DmrDevice,
+    url_suffix: str,
+    kwargs: Mapping[str, Any],
+    expected_upnp_class: str,
+    expected_protocol_info: str,
+) -> None:
+    """Test type options for construct_play_media_metadata with server info."""
+    # pylint: disable=too-many-arguments
+    profile = dmr_profile
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            override_mime_type="video/test-mime",
-            override_dlna_features="DLNA_OVERRIDE_FEATURES",
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/test-mime:DLNA_OVERRIDE_FEATURES"
-    )
+    media_url = "http://dlna_dms:4321/object/file_1222" + url_suffix
+    media_title = "Test music"
 
     # Media server supplies media information for HEAD requests
-    requester.response_map[("HEAD", media_url)] = (
-        200,
-        {
-            "ContentFeatures.dlna.org": "DLNA_SERVER_FEATURES",
-            "Content-Type": "video/server-mime",
-        },
-        "",
-    )
-    requester.response_map[("HEAD", media_url + ".mp3")] = (
-        200,
-        {
-            "ContentFeatures.dlna.org": "DLNA_SERVER_FEATURES",
-            "Content-Type": "video/server-mime",
-        },
-        "",
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(media_url, media_title)
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_SERVER_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(media_url + ".mp3", media_title)
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url + ".mp3"
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_SERVER_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, default_mime_type="video/test-mime"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_SERVER_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, default_upnp_class="object.item.imageItem"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_SERVER_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, override_mime_type="image/test-mime"
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.imageItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:image/test-mime:DLNA_SERVER_FEATURES"
-    )
+    requester.response_map[("HEAD", media_url)] = SERVER_HEAD_RESPONSE
 
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url, media_title, override_upnp_class="object.item.imageItem"
-        )
-    )[0]
+    metadata = await construct_metadata(profile, media_url, media_title, **kwargs)
     assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.imageItem"
+    assert metadata.upnp_class == expected_upnp_class
     assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_SERVER_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            override_dlna_features="DLNA_OVERRIDE_FEATURES",
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.videoItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:video/server-mime:DLNA_OVERRIDE_FEATURES"
-    )
-
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            override_mime_type="image/test-mime",
-            override_dlna_features="DLNA_OVERRIDE_FEATURES",
-        )
-    )[0]
-    assert metadata.title == media_title
-    assert metadata.upnp_class == "object.item.imageItem"
-    assert metadata.res[0].uri == media_url
-    assert (
-        metadata.res[0].protocol_info
-        == "http-get:*:image/test-mime:DLNA_OVERRIDE_FEATURES"
-    )
+    assert metadata.res[0].protocol_info == expected_protocol_info
 
 
 @pytest.mark.asyncio
-async def test_construct_play_media_metadata_meta_data() -> None:
+async def test_construct_play_media_metadata_meta_data(dmr_profile: DmrDevice) -> None:
     """Test meta_data values for construct_play_media_metadata."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = DmrDevice(device, event_handler=event_handler)
+    profile = dmr_profile
 
     media_url = "http://dlna_dms:4321/object/file_1222.mp3"
     media_title = "Test music"
@@ -684,13 +637,12 @@ async def test_construct_play_media_metadata_meta_data() -> None:
     # No server information about media type or contents
 
     # Without specifying UPnP class, only generic types lacking certain values are used
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            meta_data=meta_data,
-        )
-    )[0]
+    metadata = await construct_metadata(
+        profile,
+        media_url,
+        media_title,
+        meta_data=meta_data,
+    )
     assert metadata.upnp_class == "object.item.audioItem"
     assert metadata.title == "Test override title"
     assert metadata.description == "Short test description"
@@ -701,14 +653,13 @@ async def test_construct_play_media_metadata_meta_data() -> None:
     assert metadata.res[0].protocol_info == "http-get:*:audio/mpeg:*"
 
     # Set the UPnP class correctly
-    metadata = didl_lite.from_xml_string(
-        await profile.construct_play_media_metadata(
-            media_url,
-            media_title,
-            override_upnp_class="object.item.audioItem.musicTrack",
-            meta_data=meta_data,
-        )
-    )[0]
+    metadata = await construct_metadata(
+        profile,
+        media_url,
+        media_title,
+        override_upnp_class="object.item.audioItem.musicTrack",
+        meta_data=meta_data,
+    )
     assert metadata.upnp_class == "object.item.audioItem.musicTrack"
     assert metadata.title == "Test override title"
     assert metadata.description == "Short test description"
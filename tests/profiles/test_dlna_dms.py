@@ -2,28 +2,23 @@
 
 import pytest
 
-from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.exceptions import UpnpResponseError
 from async_upnp_client.profiles.dlna import DmsDevice
 
-from ..conftest import RESPONSE_MAP, UpnpTestNotifyServer, UpnpTestRequester, read_file
+from ..conftest import UpnpTestRequester, read_file
+
+CONTENT_DIR_CONTROL_KEY = ("POST", "http://dlna_dms:1234/upnp/control/ContentDir")
 
 
 @pytest.mark.asyncio
-async def test_async_browse_metadata() -> None:
+async def test_async_browse_metadata(
+    requester: UpnpTestRequester, dms_profile: DmsDevice
+) -> None:
     """Test retrieving object metadata."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dms:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = DmsDevice(device, event_handler=event_handler)
+    profile = dms_profile
 
     # Object 0 is the root and must always exist
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_metadata_0.xml"),
@@ -36,7 +31,7 @@ async def test_async_browse_metadata() -> None:
     assert metadata.child_count == "4"
 
     # Object 2 will give some different results
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_metadata_2.xml"),
@@ -49,7 +44,7 @@ async def test_async_browse_metadata() -> None:
     assert metadata.child_count == "3"
 
     # Object that is an item and not a container
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_metadata_item.xml"),
@@ -80,21 +75,14 @@ async def test_async_browse_metadata() -> None:
 
 
 @pytest.mark.asyncio
-async def test_async_browse_children() -> None:
+async def test_async_browse_children(
+    requester: UpnpTestRequester, dms_profile: DmsDevice
+) -> None:
     """Test retrieving children of a container."""
-    # pylint: disable=too-many-statements
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dms:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = DmsDevice(device, event_handler=event_handler)
+    profile = dms_profile
 
     # Object 0 is the root and must always exist
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_children_0.xml"),
@@ -103,23 +91,15 @@ async def test_async_browse_children() -> None:
     assert result.number_returned == 4
     assert result.total_matches == 4
     assert result.update_id == 2333
-    children = result.result
-    assert len(children) == 4
-    assert children[0].title == "Browse Folders"
-    assert children[0].id == "64"
-    assert children[0].child_count == "4"
-    assert children[1].title == "Music"
-    assert children[1].id == "1"
-    assert children[1].child_count == "7"
-    assert children[2].title == "Pictures"
-    assert children[2].id == "3"
-    assert children[2].child_count == "5"
-    assert children[3].title == "Video"
-    assert children[3].id == "2"
-    assert children[3].child_count == "3"
+    assert [(child.title, child.id, child.child_count) for child in result.result] == [
+        ("Browse Folders", "64", "4"),
+        ("Music", "1", "7"),
+        ("Pictures", "3", "5"),
+        ("Video", "2", "3"),
+    ]
 
     # Object 2 will give some different results
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_children_2.xml"),
@@ -128,20 +108,14 @@ async def test_async_browse_children() -> None:
     assert result.number_returned == 3
     assert result.total_matches == 3
     assert result.update_id == 2333
-    children = result.result
-    assert len(children) == 3
-    assert children[0].title == "All Video"
-    assert children[0].id == "2$8"
-    assert children[0].child_count == "583"
-    assert children[1].title == "Folders"
-    assert children[1].id == "2$15"
-    assert children[1].child_count == "2"
-    assert children[2].title == "Recently Added"
-    assert children[2].id == "2$FF0"
-    assert children[2].child_count == "50"
+    assert [(child.title, child.id, child.child_count) for child in result.result] == [
+        ("All Video", "2$8", "583"),
+        ("Folders", "2$15", "2"),
+        ("Recently Added", "2$FF0", "50"),
+    ]
 
     # Object that is an item and not a container
-    requester.response_map[("POST", "http://dlna_dms:1234/upnp/control/ContentDir")] = (
+    requester.response_map[CONTENT_DIR_CONTROL_KEY] = (
         200,
         {},
         read_file("dlna/dms/action_Browse_children_item.xml"),
@@ -1,116 +1,79 @@
 """Unit tests for the IGD profile."""
 
+from typing import Any
+
 import pytest
 
-from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.profiles.igd import IgdDevice
 
-from ..conftest import RESPONSE_MAP, UpnpTestNotifyServer, UpnpTestRequester, read_file
+from ..conftest import UpnpTestRequester, read_file
 
 
 @pytest.mark.asyncio
-async def test_init_igd_profile() -> None:
+async def test_init_igd_profile(igd_profile: IgdDevice) -> None:
     """Test if a IGD device can be initialized."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://igd:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = IgdDevice(device, event_handler=event_handler)
-    assert profile
+    assert igd_profile
 
 
 @pytest.mark.asyncio
-async def test_get_total_bytes_received() -> None:
-    """Test getting total bytes received."""
-    responses = dict(RESPONSE_MAP)
-    responses[("POST", "http://igd:1234/WANCommonInterfaceConfig")] = (
-        200,
-        {},
-        read_file("igd/action_WANCIC_GetTotalBytesReceived.xml"),
-    )
-    requester = UpnpTestRequester(responses)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://igd:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = IgdDevice(device, event_handler=event_handler)
-    total_bytes_received = await profile.async_get_total_bytes_received()
-    assert total_bytes_received == 1337
-
-
-@pytest.mark.asyncio
-async def test_get_total_packets_received_empty_response() -> None:
-    """Test getting total packets received with empty response, for broken (Draytek) device."""
-    responses = dict(RESPONSE_MAP)
-    responses[("POST", "http://igd:1234/WANCommonInterfaceConfig")] = (
-        200,
-        {},
-        read_file("igd/action_WANCIC_GetTotalPacketsReceived.xml"),
-    )
-    requester = UpnpTestRequester(responses)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://igd:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = IgdDevice(device, event_handler=event_handler)
-    total_bytes_received = await profile.async_get_total_packets_received()
-    assert total_bytes_received is None
+@pytest.mark.parametrize(
+    "url, action_file, method_name, expected",
+    (
+        (
+            "http://igd:1234/WANCommonInterfaceConfig",
+            "igd/action_WANCIC_GetTotalBytesReceived.xml",
+            "async_get_total_bytes_received",
+            1337,
+        ),
+        # Empty response, for broken (Draytek) device
+        (
+            "http://igd:1234/WANCommonInterfaceConfig",
+            "igd/action_WANCIC_GetTotalPacketsReceived.xml",
+            "async_get_total_packets_received",
+            None,
+        ),
+        # Invalid uptime
+        (
+            "http://igd:1234/WANIPConnection",
+            "igd/action_WANIPConnection_GetStatusInfoInvalidUptime.xml",
+            "async_get_status_info",
+            None,
+        ),
+    ),
+)
+async def test_get_action_result(
+    requester: UpnpTestRequester,
+    igd_profile: IgdDevice,
+    url: str,
+    action_file: str,
+    method_name: str,
+    expected: Any,
+) -> None:
+    """Test getting the (possibly invalid) result of an action."""
+    # pylint: disable=too-many-arguments
+    profile = igd_profile
 
-
-@pytest.mark.asyncio
-async def test_get_status_info_invalid_uptime() -> None:
-    """Test getting status info with an invalid uptime response."""
-    responses = dict(RESPONSE_MAP)
-    responses[("POST", "http://igd:1234/WANIPConnection")] = (
-        200,
-        {},
-        read_file("igd/action_WANIPConnection_GetStatusInfoInvalidUptime.xml"),
-    )
-    requester = UpnpTestRequester(responses)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://igd:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = IgdDevice(device, event_handler=event_handler)
-    status_info = await profile.async_get_status_info()
-    assert status_info is None
+    requester.response_map[("POST", url)] = (200, {}, read_file(action_file))
+    result = await getattr(profile, method_name)()
+    assert result == expected
 
 
 @pytest.mark.asyncio
-async def test_negative_bytes_received_counter() -> None:
+async def test_negative_bytes_received_counter(
+    requester: UpnpTestRequester, igd_profile: IgdDevice
+) -> None:
     """
     Test getting a negative total bytes received counter.
 
     Some devices implement the counter as a signed integer (i4),
     which can result in negative values.
     """
-    responses = dict(RESPONSE_MAP)
-    responses[("POST", "http://igd:1234/WANCommonInterfaceConfig")] = (
+    profile = igd_profile
+
+    requester.response_map[("POST", "http://igd:1234/WANCommonInterfaceConfig")] = (
         200,
         {},
         read_file("igd/action_WANCIC_GetTotalBytesReceived_i4.xml"),
     )
-    requester = UpnpTestRequester(responses)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://igd:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    profile = IgdDevice(device, event_handler=event_handler)
     total_bytes_received = await profile.async_get_total_bytes_received()
     assert total_bytes_received == 1615498126  # 2**31 + -531985522
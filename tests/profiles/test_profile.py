@@ -2,12 +2,14 @@
 # pylint: disable=protected-access
 
 import asyncio
-import time
+import selectors
 from datetime import timedelta
+from typing import Generator, List, Optional, Sequence, Tuple
 from unittest.mock import Mock
 
 import pytest
 
+from async_upnp_client.client import UpnpDevice, UpnpService, UpnpStateVariable
 from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.exceptions import (
     UpnpActionResponseError,
@@ -18,72 +20,120 @@ from async_upnp_client.exceptions import (
 from async_upnp_client.profiles.dlna import DmrDevice
 from async_upnp_client.profiles.igd import IgdDevice
 
-from ..conftest import RESPONSE_MAP, UpnpTestNotifyServer, UpnpTestRequester, read_file
+from ..conftest import RESPONSE_MAP, UpnpTestRequester, clone_device, read_file
+
+# State variables changed by action_GetPositionInfo.xml, in the order they are reported
+POSITION_INFO_STATE_VARIABLES = (
+    "CurrentTrack",
+    "CurrentTrackDuration",
+    "CurrentTrackMetaData",
+    "CurrentTrackURI",
+    "RelativeTimePosition",
+    "AbsoluteTimePosition",
+    "RelativeCounterPosition",
+    "AbsoluteCounterPosition",
+)
 
+# SIDs of the subscriptions to the AVTransport, ConnectionManager and RenderingControl
+DMR_SUBSCRIPTION_SIDS = frozenset({"uuid:dummy-avt1", "uuid:dummy-cm1", "uuid:dummy"})
 
-class TestUpnpProfileDevice:
-    """Test UPnpProfileDevice."""
 
-    @pytest.mark.asyncio
-    async def test_action_exists(self) -> None:
-        """Test getting existing action."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+class VirtualClockSelector(selectors.DefaultSelector):
+    """Selector which advances a virtual clock instead of waiting for timers."""
 
-        # doesn't error
-        assert profile._action("RC", "GetMute") is not None
+    # pylint: disable=too-many-ancestors
 
-    @pytest.mark.asyncio
-    async def test_action_not_exists(self) -> None:
-        """Test getting non-existing action."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+    def __init__(self) -> None:
+        """Initialize."""
+        super().__init__()
+        self.now = 0.0
+
+    def select(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[selectors.SelectorKey, int]]:
+        """Poll for I/O, jumping ahead to the next timer when there is none."""
+        if timeout is None:
+            return super().select(timeout)
+
+        ready = super().select(0)
+        if not ready:
+            self.now += timeout
+        return ready
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop on a virtual clock, timers fire without waiting in real time."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._virtual_clock = VirtualClockSelector()
+        super().__init__(self._virtual_clock)
+
+    def time(self) -> float:
+        """Get the virtual time."""
+        return self._virtual_clock.now
 
+
+@pytest.fixture
+def event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """Run the tests on a virtual clock, which the profile's timer follows as well."""
+    loop = VirtualClockEventLoop()
+    monkeypatch.setattr("async_upnp_client.profiles.profile.monotonic_timer", loop.time)
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="class")
+def shared_dmr_profile(
+    dmr_device_template: UpnpDevice, module_requester: UpnpTestRequester
+) -> DmrDevice:
+    """Get a DmrDevice profile, shared by the read-only tests of a class."""
+    device = clone_device(dmr_device_template, module_requester)
+    return DmrDevice(device, event_handler=None)
+
+
+class TestUpnpProfileDevice:
+    """Test UPnpProfileDevice."""
+
+    @pytest.mark.parametrize(
+        "action_name, exists",
+        (
+            ("GetMute", True),
+            ("NonExisting", False),
+        ),
+    )
+    def test_action_exists(
+        self, shared_dmr_profile: DmrDevice, action_name: str, exists: bool
+    ) -> None:
+        """Test getting existing and non-existing actions."""
+        # pylint: disable=redefined-outer-name
         # doesn't error
-        assert profile._action("RC", "NonExisting") is None
+        action = shared_dmr_profile._action("RC", action_name)
+        assert (action is not None) is exists
 
-    @pytest.mark.asyncio
-    async def test_icon(self) -> None:
+    def test_icon(self, shared_dmr_profile: DmrDevice) -> None:
         """Test getting an icon returns the best available."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
-
-        assert profile.icon == "http://dlna_dmr:1234/device_icon_120.png"
+        # pylint: disable=redefined-outer-name
+        assert shared_dmr_profile.icon == "http://dlna_dmr:1234/device_icon_120.png"
 
     @pytest.mark.asyncio
     async def test_is_profile_device(self) -> None:
         """Test is_profile_device works for root and embedded devices."""
         requester = UpnpTestRequester(RESPONSE_MAP)
         factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        embedded = await factory.async_create_device(
-            "http://dlna_dmr:1234/device_embedded.xml"
-        )
-        no_services = await factory.async_create_device(
-            "http://dlna_dmr:1234/device_incomplete.xml"
+        device, embedded, no_services, igd_device = await asyncio.gather(
+            *(
+                factory.async_create_device(url)
+                for url in (
+                    "http://dlna_dmr:1234/device.xml",
+                    "http://dlna_dmr:1234/device_embedded.xml",
+                    "http://dlna_dmr:1234/device_incomplete.xml",
+                    "http://igd:1234/device.xml",
+                )
+            )
         )
-        igd_device = await factory.async_create_device("http://igd:1234/device.xml")
 
         assert DmrDevice.is_profile_device(device) is True
         assert DmrDevice.is_profile_device(embedded) is True
@@ -100,17 +150,24 @@ class TestUpnpProfileDevice:
         """Test is_profile_device works for root and embedded devices."""
         requester = UpnpTestRequester(RESPONSE_MAP)
         factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        embedded = await factory.async_create_device(
-            "http://dlna_dmr:1234/device_embedded.xml"
-        )
-        no_services = await factory.async_create_device(
-            "http://dlna_dmr:1234/device_incomplete.xml"
-        )
-        empty_descriptor = await factory.async_create_device(
-            "http://dlna_dmr:1234/device_with_empty_descriptor.xml"
+        (
+            device,
+            embedded,
+            no_services,
+            empty_descriptor,
+            igd_device,
+        ) = await asyncio.gather(
+            *(
+                factory.async_create_device(url)
+                for url in (
+                    "http://dlna_dmr:1234/device.xml",
+                    "http://dlna_dmr:1234/device_embedded.xml",
+                    "http://dlna_dmr:1234/device_incomplete.xml",
+                    "http://dlna_dmr:1234/device_with_empty_descriptor.xml",
+                    "http://igd:1234/device.xml",
+                )
+            )
         )
-        igd_device = await factory.async_create_device("http://igd:1234/device.xml")
 
         assert DmrDevice.is_profile_device(device) is True
         assert DmrDevice.is_profile_device(embedded) is True
@@ -124,18 +181,12 @@ class TestUpnpProfileDevice:
         assert IgdDevice.is_profile_device(igd_device) is True
 
     @pytest.mark.asyncio
-    async def test_subscribe_manual_resubscribe(self) -> None:
+    async def test_subscribe_manual_resubscribe(
+        self, requester: UpnpTestRequester, dmr_evented_profile: DmrDevice
+    ) -> None:
         """Test subscribing, resub, unsub, without auto_resubscribe."""
-        now = time.monotonic()
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+        now = asyncio.get_running_loop().time()
+        profile = dmr_evented_profile
 
         # Test subscription
         timeout = await profile.async_subscribe_services(auto_resubscribe=False)
@@ -143,59 +194,46 @@ class TestUpnpProfileDevice:
         # Timeout incorporates time tolerance, and is minimal renewal time
         assert timedelta(seconds=149 - 60) <= timeout <= timedelta(seconds=151 - 60)
 
-        assert set(profile._subscriptions.keys()) == {
-            "uuid:dummy-avt1",
-            "uuid:dummy-cm1",
-            "uuid:dummy",
-        }
+        assert profile._subscriptions.keys() == DMR_SUBSCRIPTION_SIDS
 
         # 3 timeouts, ~ 150, ~ 175, and ~ 300 seconds
         timeouts = sorted(profile._subscriptions.values())
-        assert timeouts[0] == pytest.approx(now + 150, abs=1)
-        assert timeouts[1] == pytest.approx(now + 175, abs=1)
-        assert timeouts[2] == pytest.approx(now + 300, abs=1)
+        assert timeouts[0] == now + 150
+        assert timeouts[1] == now + 175
+        assert timeouts[2] == now + 300
 
         # Tweak timeouts to check resubscription did something
         requester.response_map[
             ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1")
-        ][1]["timeout"] = "Second-90"
+        ] = (200, {"sid": "uuid:dummy", "timeout": "Second-90"}, "")
 
         # Check subscriptions again, now timeouts should have changed
+        now = asyncio.get_running_loop().time()
         timeout = await profile.async_subscribe_services(auto_resubscribe=False)
         assert timeout is not None
         assert timedelta(seconds=89 - 60) <= timeout <= timedelta(seconds=91 - 60)
-        assert set(profile._subscriptions.keys()) == {
-            "uuid:dummy-avt1",
-            "uuid:dummy-cm1",
-            "uuid:dummy",
-        }
+        assert profile._subscriptions.keys() == DMR_SUBSCRIPTION_SIDS
         timeouts = sorted(profile._subscriptions.values())
-        assert timeouts[0] == pytest.approx(now + 90, abs=1)
-        assert timeouts[1] == pytest.approx(now + 150, abs=1)
+        assert timeouts[0] == now + 90
+        assert timeouts[1] == now + 150
 
         # Test unsubscription
         await profile.async_unsubscribe_services()
         assert not profile._subscriptions
 
     @pytest.mark.asyncio
-    async def test_subscribe_auto_resubscribe(self) -> None:
+    async def test_subscribe_auto_resubscribe(
+        self, requester: UpnpTestRequester, dmr_evented_profile: DmrDevice
+    ) -> None:
         """Test subscribing, resub, unsub, with auto_resubscribe."""
-        now = time.monotonic()
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+        now = asyncio.get_running_loop().time()
+        profile = dmr_evented_profile
 
         # Tweak timeouts to get a resubscription in a time suitable for testing.
         # Resubscription tolerance (60 seconds) + 1 second to get set up
         requester.response_map[
             ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1")
-        ][1]["timeout"] = "Second-61"
+        ] = (200, {"sid": "uuid:dummy", "timeout": "Second-61"}, "")
 
         # Test subscription
         timeout = await profile.async_subscribe_services(auto_resubscribe=True)
@@ -203,14 +241,10 @@ class TestUpnpProfileDevice:
         assert profile.is_subscribed is True
 
         # Check subscriptions are correct
-        assert set(profile._subscriptions.keys()) == {
-            "uuid:dummy-avt1",
-            "uuid:dummy-cm1",
-            "uuid:dummy",
-        }
+        assert profile._subscriptions.keys() == DMR_SUBSCRIPTION_SIDS
         timeouts = sorted(profile._subscriptions.values())
-        assert timeouts[0] == pytest.approx(now + 61, abs=1)
-        assert timeouts[1] == pytest.approx(now + 150, abs=1)
+        assert timeouts[0] == now + 61
+        assert timeouts[1] == now + 150
 
         # Check task is running
         assert isinstance(profile._resubscriber_task, asyncio.Task)
@@ -220,21 +254,17 @@ class TestUpnpProfileDevice:
         # Re-tweak timeouts to check resubscription did something
         requester.response_map[
             ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/AVTransport1")
-        ][1]["timeout"] = "Second-90"
+        ] = (200, {"sid": "uuid:dummy-avt1", "timeout": "Second-90"}, "")
 
-        # Wait for an auto-resubscribe
+        # Wait for an auto-resubscribe, which happens 1 second after subscribing
         await asyncio.sleep(1.5)
-        now = time.monotonic()
+        now += 1
 
         # Check subscriptions and task again
-        assert set(profile._subscriptions.keys()) == {
-            "uuid:dummy-avt1",
-            "uuid:dummy-cm1",
-            "uuid:dummy",
-        }
+        assert profile._subscriptions.keys() == DMR_SUBSCRIPTION_SIDS
         timeouts = sorted(profile._subscriptions.values())
-        assert timeouts[0] == pytest.approx(now + 61, abs=1)
-        assert timeouts[1] == pytest.approx(now + 90, abs=1)
+        assert timeouts[0] == now + 61
+        assert timeouts[1] == now + 90
         assert isinstance(profile._resubscriber_task, asyncio.Task)
         assert not profile._resubscriber_task.cancelled()
         assert not profile._resubscriber_task.done()
@@ -249,17 +279,11 @@ class TestUpnpProfileDevice:
         assert profile.is_subscribed is False
 
     @pytest.mark.asyncio
-    async def test_subscribe_fail(self) -> None:
+    async def test_subscribe_fail(
+        self, requester: UpnpTestRequester, dmr_evented_profile: DmrDevice
+    ) -> None:
         """Test subscribing fails with UpnpError if device is offline."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+        profile = dmr_evented_profile
 
         # First request is fine, 2nd raises an exception, when trying to subscribe
         requester.exceptions.append(None)
@@ -274,17 +298,11 @@ class TestUpnpProfileDevice:
         assert profile.is_subscribed is False
 
     @pytest.mark.asyncio
-    async def test_subscribe_rejected(self) -> None:
+    async def test_subscribe_rejected(
+        self, requester: UpnpTestRequester, dmr_evented_profile: DmrDevice
+    ) -> None:
         """Test subscribing rejected by device."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+        profile = dmr_evented_profile
 
         # All requests give a response error
         requester.exceptions.append(UpnpResponseError(status=501))
@@ -299,27 +317,28 @@ class TestUpnpProfileDevice:
         assert profile.is_subscribed is False
 
     @pytest.mark.asyncio
-    async def test_auto_resubscribe_fail(self) -> None:
+    async def test_auto_resubscribe_fail(
+        self, requester: UpnpTestRequester, dmr_evented_profile: DmrDevice
+    ) -> None:
         """Test auto-resubscription when the device goes offline."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
+        profile = dmr_evented_profile
+        device = profile.device
         assert device.available is True
 
         # Register an event handler
-        on_event_mock = Mock(return_value=None)
-        profile.on_event = on_event_mock
+        events: List[Tuple[UpnpService, Sequence[UpnpStateVariable]]] = []
+
+        def on_event(
+            service: UpnpService, state_variables: Sequence[UpnpStateVariable]
+        ) -> None:
+            events.append((service, state_variables))
+
+        profile.on_event = on_event
 
         # Setup for auto-resubscription
         requester.response_map[
             ("SUBSCRIBE", "http://dlna_dmr:1234/upnp/event/RenderingControl1")
-        ][1]["timeout"] = "Second-61"
+        ] = (200, {"sid": "uuid:dummy", "timeout": "Second-61"}, "")
         await profile.async_subscribe_services(auto_resubscribe=True)
 
         # Exception raised when trying to resubscribe and subsequent retry subscribe
@@ -331,9 +350,9 @@ class TestUpnpProfileDevice:
 
         # Device should now be offline, and an event notification sent
         assert device.available is False
-        on_event_mock.assert_called_once_with(
-            device.services["urn:schemas-upnp-org:service:RenderingControl:1"], []
-        )
+        assert events == [
+            (device.services["urn:schemas-upnp-org:service:RenderingControl:1"], [])
+        ]
         # Device will still be subscribed because a notification was sent via
         # on_event instead of raising an exception.
         assert profile.is_subscribed is True
@@ -348,36 +367,29 @@ class TestUpnpProfileDevice:
         assert profile.is_subscribed is False
 
     @pytest.mark.asyncio
-    async def test_subscribe_no_event_handler(self) -> None:
+    async def test_subscribe_no_event_handler(self, dmr_profile: DmrDevice) -> None:
         """Test no event handler."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        profile = DmrDevice(device, event_handler=None)
+        profile = dmr_profile
 
         # Doesn't error, but also doesn't do anything.
         await profile.async_subscribe_services()
 
     @pytest.mark.asyncio
-    async def test_poll_state_variables(self) -> None:
+    async def test_poll_state_variables(
+        self, requester: UpnpTestRequester, dmr_profile: DmrDevice
+    ) -> None:
         """Test polling state variables by calling a Get* action."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
+        profile = dmr_profile
+        device = profile.device
+
         requester.response_map[
             ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
         ] = (200, {}, read_file("dlna/dmr/action_GetPositionInfo.xml"))
 
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        notify_server = UpnpTestNotifyServer(
-            requester=requester,
-            source=("192.168.1.2", 8090),
-        )
-        event_handler = notify_server.event_handler
-        profile = DmrDevice(device, event_handler=event_handler)
         assert device.available is True
 
         # Register an event handler, it should be called when variable is updated
-        on_event_mock = Mock(return_value=None)
+        on_event_mock = Mock()
         profile.on_event = on_event_mock
         assert profile.is_subscribed is False
 
@@ -398,16 +410,7 @@ class TestUpnpProfileDevice:
         expected_service = device.services["urn:schemas-upnp-org:service:AVTransport:1"]
         expected_changes = [
             expected_service.state_variables[name]
-            for name in (
-                "CurrentTrack",
-                "CurrentTrackDuration",
-                "CurrentTrackMetaData",
-                "CurrentTrackURI",
-                "RelativeTimePosition",
-                "AbsoluteTimePosition",
-                "RelativeCounterPosition",
-                "AbsoluteCounterPosition",
-            )
+            for name in POSITION_INFO_STATE_VARIABLES
         ]
         on_event_mock.assert_called_once_with(expected_service, expected_changes)
 
@@ -420,20 +423,21 @@ class TestUpnpProfileDevice:
         assert profile.media_artist == "A & B > C"
 
     @pytest.mark.asyncio
-    async def test_poll_state_variables_missing_action(self) -> None:
+    async def test_poll_state_variables_missing_action(
+        self, requester: UpnpTestRequester, dmr_profile: DmrDevice
+    ) -> None:
         """Test missing action used when polling state variables is handled gracefully."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
+        profile = dmr_profile
+        device = profile.device
+
         requester.response_map[
             ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
         ] = (200, {}, read_file("dlna/dmr/action_GetPositionInfo.xml"))
 
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        profile = DmrDevice(device, event_handler=None)
         assert device.available is True
 
         # Register an event handler, it should be called when variable is updated
-        on_event_mock = Mock(return_value=None)
+        on_event_mock = Mock()
         profile.on_event = on_event_mock
         assert profile.is_subscribed is False
 
@@ -456,16 +460,7 @@ class TestUpnpProfileDevice:
         expected_service = device.services["urn:schemas-upnp-org:service:AVTransport:1"]
         expected_changes = [
             expected_service.state_variables[name]
-            for name in (
-                "CurrentTrack",
-                "CurrentTrackDuration",
-                "CurrentTrackMetaData",
-                "CurrentTrackURI",
-                "RelativeTimePosition",
-                "AbsoluteTimePosition",
-                "RelativeCounterPosition",
-                "AbsoluteCounterPosition",
-            )
+            for name in POSITION_INFO_STATE_VARIABLES
         ]
         on_event_mock.assert_called_once_with(expected_service, expected_changes)
 
@@ -478,21 +473,22 @@ class TestUpnpProfileDevice:
         assert profile.media_artist == "A & B > C"
 
     @pytest.mark.asyncio
-    async def test_poll_state_variables_failed_action(self) -> None:
+    async def test_poll_state_variables_failed_action(
+        self, requester: UpnpTestRequester, dmr_profile: DmrDevice
+    ) -> None:
         """Test failed action used when polling state variables is handled gracefully."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
+        profile = dmr_profile
+        device = profile.device
+
         # Good action response
         requester.response_map[
             ("POST", "http://dlna_dmr:1234/upnp/control/AVTransport1")
         ] = (200, {}, read_file("dlna/dmr/action_GetPositionInfo.xml"))
 
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        profile = DmrDevice(device, event_handler=None)
         assert device.available is True
 
         # Register an event handler, it should be called when variable is updated
-        on_event_mock = Mock(return_value=None)
+        on_event_mock = Mock()
         profile.on_event = on_event_mock
         assert profile.is_subscribed is False
 
@@ -522,16 +518,7 @@ class TestUpnpProfileDevice:
         expected_service = device.services["urn:schemas-upnp-org:service:AVTransport:1"]
         expected_changes = [
             expected_service.state_variables[name]
-            for name in (
-                "CurrentTrack",
-                "CurrentTrackDuration",
-                "CurrentTrackMetaData",
-                "CurrentTrackURI",
-                "RelativeTimePosition",
-                "AbsoluteTimePosition",
-                "RelativeCounterPosition",
-                "AbsoluteCounterPosition",
-            )
+            for name in POSITION_INFO_STATE_VARIABLES
         ]
         on_event_mock.assert_called_once_with(expected_service, expected_changes)
 
@@ -1,11 +1,11 @@
 """Unit tests for advertisement."""
 
-from unittest.mock import AsyncMock
+from typing import Type
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from async_upnp_client.advertisement import SsdpAdvertisementListener
-from async_upnp_client.utils import CaseInsensitiveDict
 
 from .common import (
     ADVERTISEMENT_HEADERS_DEFAULT,
@@ -15,84 +15,67 @@ from .common import (
 )
 
 
+@pytest.mark.parametrize(
+    "prefix, mock_class", [("async_on_", AsyncMock), ("on_", Mock)]
+)
+@pytest.mark.parametrize(
+    "nts, event",
+    [
+        ("ssdp:alive", "alive"),
+        ("ssdp:byebye", "byebye"),
+        ("ssdp:update", "update"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_receive_ssdp_alive() -> None:
-    """Test handling a ssdp:alive advertisement."""
+async def test_receive_ssdp_advertisement(
+    prefix: str, mock_class: Type[Mock], nts: str, event: str
+) -> None:
+    """Test handling a ssdp:alive/ssdp:byebye/ssdp:update advertisement."""
     # pylint: disable=protected-access
-    async_on_alive = AsyncMock()
-    async_on_byebye = AsyncMock()
-    async_on_update = AsyncMock()
-    listener = SsdpAdvertisementListener(
-        async_on_alive=async_on_alive,
-        async_on_byebye=async_on_byebye,
-        async_on_update=async_on_update,
-    )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:alive"
+    callbacks = {prefix + name: mock_class() for name in ("alive", "byebye", "update")}
+    listener = SsdpAdvertisementListener(**callbacks)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
+    headers["NTS"] = nts
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
-    async_on_alive.assert_called_with(headers)
-    async_on_byebye.assert_not_called()
-    async_on_update.assert_not_called()
+    for name, callback in callbacks.items():
+        if name == prefix + event:
+            callback.assert_called_with(headers)
+        else:
+            callback.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_receive_ssdp_byebye() -> None:
-    """Test handling a ssdp:alive advertisement."""
+async def test_receive_ssdp_search_response() -> None:
+    """Test handling a ssdp search response, which is ignored."""
     # pylint: disable=protected-access
-    async_on_alive = AsyncMock()
-    async_on_byebye = AsyncMock()
-    async_on_update = AsyncMock()
+    on_alive = Mock()
+    on_byebye = Mock()
+    on_update = Mock()
     listener = SsdpAdvertisementListener(
-        async_on_alive=async_on_alive,
-        async_on_byebye=async_on_byebye,
-        async_on_update=async_on_update,
+        on_alive=on_alive,
+        on_byebye=on_byebye,
+        on_update=on_update,
     )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:byebye"
-    listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
+    listener._on_data(SEARCH_REQUEST_LINE, headers)
 
-    async_on_alive.assert_not_called()
-    async_on_byebye.assert_called_with(headers)
-    async_on_update.assert_not_called()
+    on_alive.assert_not_called()
+    on_byebye.assert_not_called()
+    on_update.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_receive_ssdp_update() -> None:
-    """Test handling a ssdp:alive advertisement."""
+async def test_receive_ssdp_advertisement_reassigned_callback() -> None:
+    """Test a callback reassigned after construction is used."""
     # pylint: disable=protected-access
-    async_on_alive = AsyncMock()
-    async_on_byebye = AsyncMock()
-    async_on_update = AsyncMock()
-    listener = SsdpAdvertisementListener(
-        async_on_alive=async_on_alive,
-        async_on_byebye=async_on_byebye,
-        async_on_update=async_on_update,
-    )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:update"
+    on_alive = Mock()
+    listener = SsdpAdvertisementListener(on_alive=on_alive)
+    new_on_alive = Mock()
+    listener.on_alive = new_on_alive
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
+    headers["NTS"] = "ssdp:alive"
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
-    async_on_alive.assert_not_called()
-    async_on_byebye.assert_not_called()
-    async_on_update.assert_called_with(headers)
-
-
-@pytest.mark.asyncio
-async def test_receive_ssdp_search_response() -> None:
-    """Test handling a ssdp search response, which is ignored."""
-    # pylint: disable=protected-access
-    async_on_alive = AsyncMock()
-    async_on_byebye = AsyncMock()
-    async_on_update = AsyncMock()
-    listener = SsdpAdvertisementListener(
-        async_on_alive=async_on_alive,
-        async_on_byebye=async_on_byebye,
-        async_on_update=async_on_update,
-    )
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
-    listener._on_data(SEARCH_REQUEST_LINE, headers)
-
-    async_on_alive.assert_not_called()
-    async_on_byebye.assert_not_called()
-    async_on_update.assert_not_called()
+    on_alive.assert_not_called()
+    new_on_alive.assert_called_with(headers)
@@ -1,6 +1,7 @@
 """Unit tests for aiohttp."""
 # pylint: disable=protected-access
 
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,7 +13,7 @@ from async_upnp_client.aiohttp import (
 )
 from async_upnp_client.exceptions import UpnpCommunicationError
 
-from .conftest import RESPONSE_MAP, UpnpTestRequester
+from .conftest import UpnpTestRequester
 
 
 def test_fixed_host_header() -> None:
@@ -37,22 +38,27 @@ def test_fixed_host_header() -> None:
     assert _fixed_host_header("http://[fe80::1]:8000/root%desc") == {}
 
 
+@pytest.mark.parametrize(
+    "callback_url, expected_callback_url",
+    [
+        (None, "http://192.168.1.2:8090/notify"),
+        ("http://1.2.3.4:8091/", "http://1.2.3.4:8091/"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_server_init() -> None:
+async def test_server_init(
+    module_requester: UpnpTestRequester,
+    callback_url: Optional[str],
+    expected_callback_url: str,
+) -> None:
     """Test initialization of an AiohttpNotifyServer."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    server = AiohttpNotifyServer(requester, ("192.168.1.2", 8090))
+    server = AiohttpNotifyServer(module_requester, ("192.168.1.2", 8090), callback_url)
     assert server._loop is not None
     assert server.listen_host == "192.168.1.2"
     assert server.listen_port == 8090
-    assert server.callback_url == "http://192.168.1.2:8090/notify"
+    assert server.callback_url == expected_callback_url
     assert server.event_handler is not None
 
-    server = AiohttpNotifyServer(
-        requester, ("192.168.1.2", 8090), "http://1.2.3.4:8091/"
-    )
-    assert server.callback_url == "http://1.2.3.4:8091/"
-
 
 @pytest.mark.asyncio
 @patch(
@@ -64,3 +70,18 @@ async def test_client_decode_error(_mock_request: MagicMock) -> None:
     requester = AiohttpRequester()
     with pytest.raises(UpnpCommunicationError):
         await requester.async_http_request("GET", "http://192.168.1.1/desc.xml")
+
+
+@pytest.mark.asyncio
+async def test_server_start_ephemeral_port(
+    module_requester: UpnpTestRequester,
+) -> None:
+    """Test starting an AiohttpNotifyServer at a port chosen by the OS."""
+    server = AiohttpNotifyServer(module_requester, ("127.0.0.1", 0))
+    await server.async_start_server()
+    try:
+        assert server.listen_host == "127.0.0.1"
+        assert server.listen_port != 0
+        assert server.callback_url == f"http://127.0.0.1:{server.listen_port}/notify"
+    finally:
+        await server.async_stop_server()
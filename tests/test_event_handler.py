@@ -7,9 +7,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from async_upnp_client.client import UpnpService, UpnpStateVariable
+from async_upnp_client.client import UpnpDevice, UpnpService, UpnpStateVariable
 from async_upnp_client.client_factory import UpnpFactory
-from async_upnp_client.event_handler import UpnpEventHandlerRegister
+from async_upnp_client.event_handler import UpnpEventHandler, UpnpEventHandlerRegister
 
 from .conftest import RESPONSE_MAP, UpnpTestNotifyServer, UpnpTestRequester
 
@@ -22,18 +22,12 @@ def patched_local_ip() -> Generator:
 
 
 @pytest.mark.asyncio
-async def test_subscribe() -> None:
+async def test_subscribe(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test subscribing to a UpnpService."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-
-    service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+    event_handler = dmr_event_handler
+    service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
     sid, timeout = await event_handler.async_subscribe(service)
     assert event_handler.service_for_sid("uuid:dummy") == service
     assert sid == "uuid:dummy"
@@ -42,18 +36,12 @@ async def test_subscribe() -> None:
 
 
 @pytest.mark.asyncio
-async def test_subscribe_renew() -> None:
+async def test_subscribe_renew(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test renewing an existing subscription to a UpnpService."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-
-    service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+    event_handler = dmr_event_handler
+    service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
     sid, timeout = await event_handler.async_subscribe(service)
     assert sid == "uuid:dummy"
     assert event_handler.service_for_sid("uuid:dummy") == service
@@ -66,18 +54,12 @@ async def test_subscribe_renew() -> None:
 
 
 @pytest.mark.asyncio
-async def test_unsubscribe() -> None:
+async def test_unsubscribe(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test unsubscribing from a UpnpService."""
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-
-    service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+    event_handler = dmr_event_handler
+    service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
     sid, timeout = await event_handler.async_subscribe(service)
     assert event_handler.service_for_sid("uuid:dummy") == service
     assert sid == "uuid:dummy"
@@ -89,7 +71,9 @@ async def test_unsubscribe() -> None:
 
 
 @pytest.mark.asyncio
-async def test_on_notify_upnp_event() -> None:
+async def test_on_notify_upnp_event(
+    dmr_device: UpnpDevice, dmr_event_handler: UpnpEventHandler
+) -> None:
     """Test handling of a UPnP event."""
     changed_vars: Sequence[UpnpStateVariable] = []
 
@@ -99,15 +83,8 @@ async def test_on_notify_upnp_event() -> None:
         nonlocal changed_vars
         changed_vars = changed_state_variables
 
-    requester = UpnpTestRequester(RESPONSE_MAP)
-    notify_server = UpnpTestNotifyServer(
-        requester=requester,
-        source=("192.168.1.2", 8090),
-    )
-    event_handler = notify_server.event_handler
-    factory = UpnpFactory(requester)
-    device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-    service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+    event_handler = dmr_event_handler
+    service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
     service.on_event = on_event
     await event_handler.async_subscribe(service)
 
@@ -7,7 +7,6 @@ import pytest
 
 from async_upnp_client.search import SsdpSearchListener
 from async_upnp_client.ssdp import SSDP_IP_V4
-from async_upnp_client.utils import CaseInsensitiveDict
 
 from .common import (
     ADVERTISEMENT_HEADERS_DEFAULT,
@@ -23,7 +22,7 @@ async def test_receive_search_response() -> None:
     # pylint: disable=protected-access
     async_callback = AsyncMock()
     listener = SsdpSearchListener(async_callback=async_callback)
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     listener._on_data(SEARCH_REQUEST_LINE, headers)
 
     async_callback.assert_called_with(headers)
@@ -56,7 +55,7 @@ async def test_receive_ssdp_alive_advertisement() -> None:
     """Test handling a ssdp alive advertisement, which is ignored."""
     async_callback = AsyncMock()
     listener = SsdpSearchListener(async_callback=async_callback)
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
     async_callback.assert_not_called()
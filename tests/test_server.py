@@ -35,6 +35,10 @@ from async_upnp_client.server import (
 
 from .conftest import read_file
 
+pytestmark = pytest.mark.skipif(
+    "config.getoption('uvloop')", reason="uvloop cannot send to AF_UNIX sockets"
+)
+
 
 class ServerServiceTest(UpnpServerService):
     """Test Service."""
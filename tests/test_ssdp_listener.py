@@ -88,7 +88,7 @@ async def test_see_advertisement_alive() -> None:
 
     # See device for the first time through alive-advertisement.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -101,7 +101,7 @@ async def test_see_advertisement_alive() -> None:
 
     # See device for the second time through alive-advertisement, not triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_not_awaited()
@@ -121,7 +121,7 @@ async def test_see_advertisement_byebye() -> None:
 
     # See device for the first time through byebye-advertisement, not triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:byebye"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_not_awaited()
@@ -129,7 +129,7 @@ async def test_see_advertisement_byebye() -> None:
 
     # See device for the first time through alive-advertisement, triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -145,7 +145,7 @@ async def test_see_advertisement_byebye() -> None:
 
     # See device for the second time through byebye-advertisement, triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:byebye"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -171,7 +171,7 @@ async def test_see_advertisement_update() -> None:
 
     # See device for the first time through alive-advertisement, triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -184,7 +184,7 @@ async def test_see_advertisement_update() -> None:
 
     # See device for the second time through update-advertisement, triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:update"
     headers["BOOTID.UPNP.ORG"] = "2"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
@@ -209,7 +209,7 @@ async def test_see_search() -> None:
 
     # See device for the first time through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -221,7 +221,7 @@ async def test_see_search() -> None:
 
     # See same device again through search, not triggering a change.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -244,7 +244,7 @@ async def test_see_search_sync() -> None:
 
     # See device for the first time through search.
     callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     callback.assert_called_with(
         ANY,
@@ -256,7 +256,7 @@ async def test_see_search_sync() -> None:
 
     # See same device again through search, not triggering a change.
     callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     callback.assert_called_with(
         ANY,
@@ -279,7 +279,7 @@ async def test_see_search_then_alive() -> None:
 
     # See device for the first time through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -291,7 +291,7 @@ async def test_see_search_then_alive() -> None:
 
     # See device for the second time through alive-advertisement, not triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_not_awaited()
@@ -311,7 +311,7 @@ async def test_see_search_then_update() -> None:
 
     # See device for the first time through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -323,7 +323,7 @@ async def test_see_search_then_update() -> None:
 
     # See device for the second time through update-advertisement, triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:update"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -347,7 +347,7 @@ async def test_see_search_then_byebye() -> None:
 
     # See device for the first time through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -360,7 +360,7 @@ async def test_see_search_then_byebye() -> None:
     # See device for the second time through byebye-advertisement,
     # triggering byebye-callback and device removed.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:byebye"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -383,7 +383,7 @@ async def test_see_search_then_byebye_then_alive() -> None:
 
     # See device for the first time through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -396,7 +396,7 @@ async def test_see_search_then_byebye_then_alive() -> None:
     # See device for the second time through byebye-advertisement,
     # triggering byebye-callback and device removed.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:byebye"
     headers["LOCATION"] = ""
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
@@ -409,7 +409,7 @@ async def test_see_search_then_byebye_then_alive() -> None:
 
     # See device for the second time through alive-advertisement, not triggering callback.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy()
     headers["NTS"] = "ssdp:alive"
     await see_advertisement(listener, ADVERTISEMENT_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
@@ -433,7 +433,7 @@ async def test_purge_devices() -> None:
 
     # See device through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -461,7 +461,7 @@ async def test_purge_devices_2() -> None:
 
     # See device through search.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     await see_search(listener, SEARCH_REQUEST_LINE, headers)
     async_callback.assert_awaited_once_with(
         ANY,
@@ -547,7 +547,7 @@ async def test_see_search_invalid_usn() -> None:
     assert advertisement_listener is not None
 
     # See device for the first time through alive-advertisement.
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     headers[
         "ST"
     ] = "urn:Microsoft Windows Peer Name Resolution Protocol: V4:IPV6:LinkLocal"
@@ -571,7 +571,7 @@ async def test_see_search_invalid_location() -> None:
 
     # See device for the first time through alive-advertisement.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     headers["location"] = "192.168.1.1"
     advertisement_listener._on_data(SEARCH_REQUEST_LINE, headers)
     async_callback.assert_not_awaited()
@@ -599,7 +599,7 @@ async def test_see_search_localhost_location(location: str) -> None:
 
     # See device for the first time through alive-advertisement.
     async_callback.reset_mock()
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     headers["location"] = location
     advertisement_listener._on_data(SEARCH_REQUEST_LINE, headers)
     async_callback.assert_not_awaited()
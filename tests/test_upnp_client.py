@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 """Unit tests for client_factory and client modules."""
 
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
-from typing import MutableMapping
+from typing import Any, Dict
 
-import defusedxml.ElementTree as DET
 import pytest
 
-from async_upnp_client.client import UpnpStateVariable
+from async_upnp_client.client import UpnpDevice, UpnpStateVariable
 from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.exceptions import (
     UpnpActionError,
@@ -27,18 +27,15 @@ class TestUpnpStateVariable:
     """Tests for UpnpStateVariable."""
 
     @pytest.mark.asyncio
-    async def test_init(self) -> None:
+    async def test_init(self, dmr_device: UpnpDevice) -> None:
         """Test initialization of a UpnpDevice."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        assert device
-        assert device.device_type == "urn:schemas-upnp-org:device:MediaRenderer:1"
+        assert dmr_device
+        assert dmr_device.device_type == "urn:schemas-upnp-org:device:MediaRenderer:1"
 
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         assert service
 
-        service_by_id = device.service_id("urn:upnp-org:serviceId:RenderingControl")
+        service_by_id = dmr_device.service_id("urn:upnp-org:serviceId:RenderingControl")
         assert service_by_id == service
 
         state_var = service.state_variable("Volume")
@@ -51,32 +48,27 @@ class TestUpnpStateVariable:
         assert argument
 
     @pytest.mark.asyncio
-    async def test_init_embedded_device(self) -> None:
+    async def test_init_embedded_device(self, igd_device: UpnpDevice) -> None:
         """Test initialization of a embedded UpnpDevice."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://igd:1234/device.xml")
-        assert device
+        assert igd_device
         assert (
-            device.device_type == "urn:schemas-upnp-org:device:InternetGatewayDevice:1"
+            igd_device.device_type
+            == "urn:schemas-upnp-org:device:InternetGatewayDevice:1"
         )
 
-        embedded_device = device.embedded_devices[
+        embedded_device = igd_device.embedded_devices[
             "urn:schemas-upnp-org:device:WANDevice:1"
         ]
         assert embedded_device
         assert embedded_device.device_type == "urn:schemas-upnp-org:device:WANDevice:1"
-        assert embedded_device.parent_device == device
+        assert embedded_device.parent_device == igd_device
 
     @pytest.mark.asyncio
-    async def test_init_xml(self) -> None:
+    async def test_init_xml(self, dmr_device: UpnpDevice) -> None:
         """Test XML is stored on every part of the UpnpDevice."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        assert device.xml is not None
+        assert dmr_device.xml is not None
 
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         assert service.xml is not None
 
         state_var = service.state_variable("Volume")
@@ -92,13 +84,12 @@ class TestUpnpStateVariable:
     @pytest.mark.asyncio
     async def test_init_bad_xml(self) -> None:
         """Test missing device element in device description."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dmr:1234/device.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[("GET", "http://dlna_dmr:1234/device.xml")] = (
             200,
             {},
             read_file("dlna/dmr/device_bad_namespace.xml"),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester)
         with pytest.raises(UpnpXmlContentError):
             await factory.async_create_device("http://dlna_dmr:1234/device.xml")
@@ -106,13 +97,12 @@ class TestUpnpStateVariable:
     @pytest.mark.asyncio
     async def test_empty_descriptor(self) -> None:
         """Test device with an empty descriptor file called in description.xml."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dmr:1234/device.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[("GET", "http://dlna_dmr:1234/device.xml")] = (
             200,
             {},
             read_file("dlna/dmr/device_with_empty_descriptor.xml"),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester)
         with pytest.raises(UpnpXmlParseError):
             await factory.async_create_device("http://dlna_dmr:1234/device.xml")
@@ -120,23 +110,19 @@ class TestUpnpStateVariable:
     @pytest.mark.asyncio
     async def test_empty_descriptor_non_strict(self) -> None:
         """Test device with an empty descriptor file called in description.xml."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dmr:1234/device.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[("GET", "http://dlna_dmr:1234/device.xml")] = (
             200,
             {},
             read_file("dlna/dmr/device_with_empty_descriptor.xml"),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester, non_strict=True)
         await factory.async_create_device("http://dlna_dmr:1234/device.xml")
 
     @pytest.mark.asyncio
-    async def test_set_value_volume(self) -> None:
+    async def test_set_value_volume(self, dmr_device: UpnpDevice) -> None:
         """Test calling parsing/reading values from UpnpStateVariable."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         state_var = service.state_variable("Volume")
 
         state_var.value = 10
@@ -148,12 +134,9 @@ class TestUpnpStateVariable:
         assert state_var.upnp_value == "20"
 
     @pytest.mark.asyncio
-    async def test_set_value_mute(self) -> None:
+    async def test_set_value_mute(self, dmr_device: UpnpDevice) -> None:
         """Test setting a boolean value."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         state_var = service.state_variable("Mute")
 
         state_var.value = True
@@ -173,12 +156,9 @@ class TestUpnpStateVariable:
         assert state_var.upnp_value == "0"
 
     @pytest.mark.asyncio
-    async def test_value_min_max(self) -> None:
+    async def test_value_min_max(self, dmr_device: UpnpDevice) -> None:
         """Test min/max restrictions."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         state_var = service.state_variable("Volume")
 
         assert state_var.min_value == 0
@@ -187,25 +167,20 @@ class TestUpnpStateVariable:
         state_var.value = 10
         assert state_var.value == 10
 
-        try:
+        with pytest.raises(UpnpValueError):
             state_var.value = -10
-            assert False
-        except UpnpValueError:
-            pass
 
-        try:
+        with pytest.raises(UpnpValueError):
             state_var.value = 110
-            assert False
-        except UpnpValueError:
-            pass
 
     @pytest.mark.asyncio
-    async def test_value_min_max_validation_disable(self) -> None:
+    async def test_value_min_max_validation_disable(
+        self, dmr_device_non_strict: UpnpDevice
+    ) -> None:
         """Test if min/max validations can be disabled."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device_non_strict.service(
+            "urn:schemas-upnp-org:service:RenderingControl:1"
+        )
         state_var = service.state_variable("Volume")
 
         # min/max are set
@@ -220,12 +195,9 @@ class TestUpnpStateVariable:
         assert state_var.value == 110
 
     @pytest.mark.asyncio
-    async def test_value_allowed_value(self) -> None:
+    async def test_value_allowed_value(self, dmr_device: UpnpDevice) -> None:
         """Test handling allowed values."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         state_var = service.state_variable("A_ARG_TYPE_Channel")
 
         assert state_var.allowed_values == {"Master"}
@@ -235,19 +207,17 @@ class TestUpnpStateVariable:
         state_var.value = "Master"
         assert state_var.value == "Master"
 
-        try:
+        with pytest.raises(UpnpValueError):
             state_var.value = "Left"
-            assert False
-        except UpnpValueError:
-            pass
 
     @pytest.mark.asyncio
-    async def test_value_upnp_value_error(self) -> None:
+    async def test_value_upnp_value_error(
+        self, dmr_device_non_strict: UpnpDevice
+    ) -> None:
         """Test handling invalid values in response."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device_non_strict.service(
+            "urn:schemas-upnp-org:service:RenderingControl:1"
+        )
         state_var = service.state_variable("Volume")
 
         # should be ok
@@ -260,12 +230,11 @@ class TestUpnpStateVariable:
         assert state_var.value_unchecked is UpnpStateVariable.UPNP_VALUE_ERROR
 
     @pytest.mark.asyncio
-    async def test_value_date_time(self) -> None:
+    async def test_value_date_time(self, dmr_device_non_strict: UpnpDevice) -> None:
         """Test parsing of datetime."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device_non_strict.service(
+            "urn:schemas-upnp-org:service:RenderingControl:1"
+        )
         state_var = service.state_variable("SV1")
 
         # should be ok
@@ -273,12 +242,11 @@ class TestUpnpStateVariable:
         assert state_var.value == datetime(1985, 4, 12, 10, 15, 30)
 
     @pytest.mark.asyncio
-    async def test_value_date_time_tz(self) -> None:
+    async def test_value_date_time_tz(self, dmr_device_non_strict: UpnpDevice) -> None:
         """Test parsing of date_time with a timezone."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device_non_strict.service(
+            "urn:schemas-upnp-org:service:RenderingControl:1"
+        )
         state_var = service.state_variable("SV2")
         assert state_var is not None
 
@@ -290,12 +258,9 @@ class TestUpnpStateVariable:
         assert state_var.value.tzinfo is not None
 
     @pytest.mark.asyncio
-    async def test_send_events(self) -> None:
+    async def test_send_events(self, dmr_device: UpnpDevice) -> None:
         """Test if send_events is properly handled."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
 
         state_var = service.state_variable("A_ARG_TYPE_InstanceID")  # old style
         assert state_var.send_events is False
@@ -312,13 +277,14 @@ class TestUpnpStateVariable:
     @pytest.mark.asyncio
     async def test_big_ints(self) -> None:
         """Test state variable types i8 and ui8."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dms:1234/ContentDirectory_1.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[
+            ("GET", "http://dlna_dms:1234/ContentDirectory_1.xml")
+        ] = (
             200,
             {},
             read_file("scpd_i8.xml"),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester)
         device = await factory.async_create_device("http://dlna_dms:1234/device.xml")
         assert device is not None
@@ -328,52 +294,37 @@ class TestUpnpAction:
     """Tests for UpnpAction."""
 
     @pytest.mark.asyncio
-    async def test_init(self) -> None:
+    async def test_init(self, dmr_device: UpnpDevice) -> None:
         """Test Initializing a UpnpAction."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         assert action
         assert action.name == "GetVolume"
 
     @pytest.mark.asyncio
-    async def test_valid_arguments(self) -> None:
+    async def test_valid_arguments(self, dmr_device: UpnpDevice) -> None:
         """Test validating arguments of an action."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("SetVolume")
 
         # all ok
         action.validate_arguments(InstanceID=0, Channel="Master", DesiredVolume=10)
 
         # invalid type for InstanceID
-        try:
+        with pytest.raises(UpnpValueError):
             action.validate_arguments(
                 InstanceID="0", Channel="Master", DesiredVolume=10
             )
-            assert False
-        except UpnpValueError:
-            pass
 
         # missing DesiredVolume
-        try:
+        with pytest.raises(UpnpValueError):
             action.validate_arguments(InstanceID="0", Channel="Master")
-            assert False
-        except UpnpValueError:
-            pass
 
     @pytest.mark.asyncio
-    async def test_format_request(self) -> None:
+    async def test_format_request(self, dmr_device: UpnpDevice) -> None:
         """Test the request an action sends."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("SetVolume")
 
         service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
@@ -381,18 +332,15 @@ class TestUpnpAction:
             InstanceID=0, Channel="Master", DesiredVolume=10
         )
 
-        root = DET.fromstring(body)
+        root = ET.fromstring(body)
         namespace = {"rc_service": service_type}
         assert root.find(".//rc_service:SetVolume", namespace) is not None
         assert root.find(".//DesiredVolume", namespace) is not None
 
     @pytest.mark.asyncio
-    async def test_format_request_escape(self) -> None:
+    async def test_format_request_escape(self, dmr_device: UpnpDevice) -> None:
         """Test escaping the request an action sends."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:AVTransport:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:AVTransport:1")
         action = service.action("SetAVTransportURI")
 
         service_type = "urn:schemas-upnp-org:service:AVTransport:1"
@@ -403,7 +351,7 @@ class TestUpnpAction:
             CurrentURIMetaData=metadata,
         )
 
-        root = DET.fromstring(body)
+        root = ET.fromstring(body)
         namespace = {"avt_service": service_type}
         assert root.find(".//avt_service:SetAVTransportURI", namespace) is not None
         assert root.find(".//CurrentURIMetaData", namespace) is not None
@@ -417,41 +365,34 @@ class TestUpnpAction:
         # This shouldn't have any children, due to its contents being escaped.
         assert current_uri_metadata_el.findall("./") == []
 
+    @pytest.mark.parametrize(
+        "action_name, response_file, expected",
+        [
+            ("GetVolume", "dlna/dmr/action_GetVolume.xml", {"CurrentVolume": 3}),
+            ("SetVolume", "dlna/dmr/action_SetVolume.xml", {}),  # Empty response
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_parse_response(self) -> None:
+    async def test_parse_response(
+        self,
+        dmr_device: UpnpDevice,
+        action_name: str,
+        response_file: str,
+        expected: Dict[str, Any],
+    ) -> None:
         """Test calling an action and handling its response."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
-        action = service.action("GetVolume")
-
         service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
-        response = read_file("dlna/dmr/action_GetVolume.xml")
-        result = action.parse_response(service_type, {}, response)
-        assert result == {"CurrentVolume": 3}
-
-    @pytest.mark.asyncio
-    async def test_parse_response_empty(self) -> None:
-        """Test calling an action and handling an empty XML response."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
-        action = service.action("SetVolume")
+        service = dmr_device.service(service_type)
+        action = service.action(action_name)
 
-        service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
-        response = read_file("dlna/dmr/action_SetVolume.xml")
+        response = read_file(response_file)
         result = action.parse_response(service_type, {}, response)
-        assert result == {}
+        assert result == expected
 
     @pytest.mark.asyncio
-    async def test_parse_response_error(self) -> None:
+    async def test_parse_response_error(self, dmr_device: UpnpDevice) -> None:
         """Test calling and action and handling an invalid XML response."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
@@ -462,12 +403,9 @@ class TestUpnpAction:
         assert exc.value.error_desc == "Invalid Args"
 
     @pytest.mark.asyncio
-    async def test_parse_response_escape(self) -> None:
+    async def test_parse_response_escape(self, dmr_device: UpnpDevice) -> None:
         """Test calling an action and properly (not) escaping the response."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:AVTransport:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:AVTransport:1")
         action = service.action("GetMediaInfo")
 
         service_type = "urn:schemas-upnp-org:service:AVTransport:1"
@@ -495,81 +433,65 @@ class TestUpnpAction:
             "WriteStatus": "NOT_IMPLEMENTED",
         }
 
+    @pytest.mark.parametrize(
+        "service_type, action_name, response_file",
+        [
+            (
+                "urn:schemas-upnp-org:service:RenderingControl:1",
+                "GetVolume",
+                "dlna/dmr/action_GetVolumeInvalidServiceType.xml",
+            ),
+            (
+                "urn:schemas-upnp-org:service:AVTransport:1",
+                "GetTransportInfo",
+                "dlna/dmr/action_GetTransportInfoInvalidServiceType.xml",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_parse_response_no_service_type_version(self) -> None:
-        """Test calling and action and handling a response without service type number."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
-        action = service.action("GetVolume")
-
-        service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
-        response = read_file("dlna/dmr/action_GetVolumeInvalidServiceType.xml")
-        try:
-            action.parse_response(service_type, {}, response)
-            assert False
-        except UpnpError:
-            pass
-
-    @pytest.mark.asyncio
-    async def test_parse_response_no_service_type_version_2(self) -> None:
+    async def test_parse_response_no_service_type_version(
+        self,
+        dmr_device: UpnpDevice,
+        service_type: str,
+        action_name: str,
+        response_file: str,
+    ) -> None:
         """Test calling and action and handling a response without service type number."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:AVTransport:1")
-        action = service.action("GetTransportInfo")
+        service = dmr_device.service(service_type)
+        action = service.action(action_name)
 
-        service_type = "urn:schemas-upnp-org:service:AVTransport:1"
-        response = read_file("dlna/dmr/action_GetTransportInfoInvalidServiceType.xml")
-        try:
+        response = read_file(response_file)
+        with pytest.raises(UpnpError):
             action.parse_response(service_type, {}, response)
-            assert False
-        except UpnpError:
-            pass
 
     @pytest.mark.asyncio
-    async def test_unknown_out_argument(self) -> None:
+    async def test_unknown_out_argument(
+        self, dmr_device: UpnpDevice, dmr_device_non_strict: UpnpDevice
+    ) -> None:
         """Test calling an actino and handling an unknown out-argument."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        link_service = "http://dlna_dmr:1234/device.xml"
         service_type = "urn:schemas-upnp-org:service:RenderingControl:1"
         test_action = "GetVolume"
 
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device(link_service)
-        service = device.service(service_type)
+        service = dmr_device.service(service_type)
         action = service.action(test_action)
 
         response = read_file("dlna/dmr/action_GetVolumeExtraOutParameter.xml")
-        try:
+        with pytest.raises(UpnpError):
             action.parse_response(service_type, {}, response)
-            assert False
-        except UpnpError:
-            pass
 
-        factory = UpnpFactory(requester, non_strict=True)
-        device = await factory.async_create_device(link_service)
-        service = device.service(service_type)
+        service = dmr_device_non_strict.service(service_type)
         action = service.action(test_action)
 
-        try:
-            action.parse_response(service_type, {}, response)
-        except UpnpError:
-            assert False
+        action.parse_response(service_type, {}, response)
 
 
 class TestUpnpService:
     """Tests for UpnpService."""
 
     @pytest.mark.asyncio
-    async def test_init(self) -> None:
+    async def test_init(self, dmr_device: UpnpDevice) -> None:
         """Test initializing a UpnpService."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
 
         base_url = "http://dlna_dmr:1234"
         assert service
@@ -579,12 +501,9 @@ class TestUpnpService:
         assert service.scpd_url == base_url + "/RenderingControl_1.xml"
 
     @pytest.mark.asyncio
-    async def test_state_variables_actions(self) -> None:
+    async def test_state_variables_actions(self, dmr_device: UpnpDevice) -> None:
         """Test eding a UpnpStateVariable."""
-        requester = UpnpTestRequester(RESPONSE_MAP)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
 
         state_var = service.state_variable("Volume")
         assert state_var
@@ -593,40 +512,36 @@ class TestUpnpService:
         assert action
 
     @pytest.mark.asyncio
-    async def test_call_action(self) -> None:
+    async def test_call_action(
+        self, requester: UpnpTestRequester, dmr_device: UpnpDevice
+    ) -> None:
         """Test calling a UpnpAction."""
-        responses: MutableMapping = {
-            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1"): (
-                200,
-                {},
-                read_file("dlna/dmr/action_GetVolume.xml"),
-            )
-        }
-        responses.update(RESPONSE_MAP)
-        requester = UpnpTestRequester(responses)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        requester.response_map[
+            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1")
+        ] = (
+            200,
+            {},
+            read_file("dlna/dmr/action_GetVolume.xml"),
+        )
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         result = await service.async_call_action(action, InstanceID=0, Channel="Master")
         assert result["CurrentVolume"] == 3
 
     @pytest.mark.asyncio
-    async def test_soap_fault_http_error(self) -> None:
+    async def test_soap_fault_http_error(
+        self, requester: UpnpTestRequester, dmr_device: UpnpDevice
+    ) -> None:
         """Test an action response with HTTP error and SOAP fault raises exception."""
-        responses: MutableMapping = {
-            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1"): (
-                500,
-                {},
-                read_file("dlna/dmr/action_GetVolumeError.xml"),
-            )
-        }
-        responses.update(RESPONSE_MAP)
-        requester = UpnpTestRequester(responses)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        requester.response_map[
+            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1")
+        ] = (
+            500,
+            {},
+            read_file("dlna/dmr/action_GetVolumeError.xml"),
+        )
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         with pytest.raises(UpnpActionResponseError) as exc:
@@ -636,20 +551,18 @@ class TestUpnpService:
         assert exc.value.status == 500
 
     @pytest.mark.asyncio
-    async def test_http_error(self) -> None:
+    async def test_http_error(
+        self, requester: UpnpTestRequester, dmr_device: UpnpDevice
+    ) -> None:
         """Test an action response with HTTP error and blank body raises exception."""
-        responses: MutableMapping = {
-            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1"): (
-                500,
-                {},
-                "",
-            )
-        }
-        responses.update(RESPONSE_MAP)
-        requester = UpnpTestRequester(responses)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        requester.response_map[
+            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1")
+        ] = (
+            500,
+            {},
+            "",
+        )
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         with pytest.raises(UpnpResponseError) as exc:
@@ -657,20 +570,18 @@ class TestUpnpService:
         assert exc.value.status == 500
 
     @pytest.mark.asyncio
-    async def test_soap_fault_http_ok(self) -> None:
+    async def test_soap_fault_http_ok(
+        self, requester: UpnpTestRequester, dmr_device: UpnpDevice
+    ) -> None:
         """Test an action response with HTTP OK but SOAP fault raises exception."""
-        responses: MutableMapping = {
-            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1"): (
-                200,
-                {},
-                read_file("dlna/dmr/action_GetVolumeError.xml"),
-            )
-        }
-        responses.update(RESPONSE_MAP)
-        requester = UpnpTestRequester(responses)
-        factory = UpnpFactory(requester)
-        device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
-        service = device.service("urn:schemas-upnp-org:service:RenderingControl:1")
+        requester.response_map[
+            ("POST", "http://dlna_dmr:1234/upnp/control/RenderingControl1")
+        ] = (
+            200,
+            {},
+            read_file("dlna/dmr/action_GetVolumeError.xml"),
+        )
+        service = dmr_device.service("urn:schemas-upnp-org:service:RenderingControl:1")
         action = service.action("GetVolume")
 
         with pytest.raises(UpnpActionError) as exc:
@@ -689,13 +600,14 @@ class TestUpnpService:
     @pytest.mark.asyncio
     async def test_bad_scpd_strict(self, rc_doc: str) -> None:
         """Test handling of bad service descriptions in strict mode."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dmr:1234/RenderingControl_1.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[
+            ("GET", "http://dlna_dmr:1234/RenderingControl_1.xml")
+        ] = (
             200,
             {},
             read_file(rc_doc),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester)
         with pytest.raises(UpnpXmlContentError):
             await factory.async_create_device("http://dlna_dmr:1234/device.xml")
@@ -711,13 +623,14 @@ class TestUpnpService:
     @pytest.mark.asyncio
     async def test_bad_scpd_non_strict_fails(self, rc_doc: str) -> None:
         """Test bad SCPD in non-strict mode."""
-        responses = dict(RESPONSE_MAP)
-        responses[("GET", "http://dlna_dmr:1234/RenderingControl_1.xml")] = (
+        requester = UpnpTestRequester(RESPONSE_MAP)
+        requester.response_map[
+            ("GET", "http://dlna_dmr:1234/RenderingControl_1.xml")
+        ] = (
             200,
             {},
             read_file(rc_doc),
         )
-        requester = UpnpTestRequester(responses)
         factory = UpnpFactory(requester, non_strict=True)
         device = await factory.async_create_device("http://dlna_dmr:1234/device.xml")
         # Known good service
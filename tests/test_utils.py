@@ -41,6 +41,18 @@ def test_case_insensitive_dict_dict_equality() -> None:
     assert ci_dict == {"KEY": "value"}
 
 
+def test_case_insensitive_dict_from_case_insensitive_dict() -> None:
+    """Test creating a CaseInsensitiveDict from another CaseInsensitiveDict."""
+    original = CaseInsensitiveDict({"Key": "value"})
+    ci_dict = CaseInsensitiveDict(original)
+    ci_dict["KEY"] = "new_value"
+    ci_dict["Other"] = "other_value"
+
+    assert ci_dict.as_dict() == {"KEY": "new_value", "Other": "other_value"}
+    assert original.as_dict() == {"Key": "value"}
+    assert original.case_map() == {"key": "Key"}
+
+
 def test_case_insensitive_dict_profile() -> None:
     """Test CaseInsensitiveDict under load, for profiling."""
     for _ in range(0, 10000):